@@ -220,7 +220,9 @@ def route_id(n: int) -> str:
     return f"a1000000-0000-4000-8000-{n:012d}"
 
 def geo(lat: float, lng: float) -> str:
-    return f"ST_GeogFromText('POINT({lng} {lat})')"
+    # Numeric constructor, same as the API's writes: no WKT text for the
+    # server to parse, and the seed is re-executed on every demo reset.
+    return f"ST_SetSRID(ST_MakePoint({lng}, {lat}), 4326)::geography"
 
 def ts(minutes_from_8am: int) -> str:
     """A timestamptz expression relative to today, so the seed is always fresh."""
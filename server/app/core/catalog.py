@@ -329,10 +329,22 @@ CATALOG: Dict[str, EventTypeSpec] = {
 }
 
 
+# Every *.record-* type, for consumers that route on "is this a CDC observation"
+# with one set lookup instead of splitting the type string per event.
+RECORD_CHANGE_TYPES = frozenset(
+    name for name, spec in CATALOG.items() if spec.payload_model is RecordChangePayload
+)
+
+
 def spec_for(event_type: str) -> EventTypeSpec:
     """Look up an event type; raises KeyError for unregistered types."""
     return CATALOG[event_type]
 
 
+# Flat event type -> topic map for the per-message publish path.
+TOPIC_BY_TYPE: Dict[str, str] = {name: spec.topic for name, spec in CATALOG.items()}
+
+
 def topic_for(event_type: str) -> str:
-    return spec_for(event_type).topic
+    """Topic for an event type; raises KeyError for unregistered types."""
+    return TOPIC_BY_TYPE[event_type]
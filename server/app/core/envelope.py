@@ -65,6 +65,12 @@ class SourceSystem(str, Enum):
     SEEDER = "lip-seeder"
 
 
+# value -> member for from_trusted_wire: one dict hit per value instead of
+# Enum.__call__ and its ValueError path on a miss.
+_SOURCE_SYSTEMS: Dict[str, SourceSystem] = {m.value: m for m in SourceSystem}
+_ENTITY_TYPES: Dict[str, EntityType] = {m.value: m for m in EntityType}
+
+
 class EntityRef(BaseModel):
     """A typed reference to a canonical entity touched by the event."""
 
@@ -112,10 +118,39 @@ class EventEnvelope(BaseModel):
     def serialize_ts(self, v: datetime) -> str:
         return v.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
+    @classmethod
+    def from_trusted_wire(cls, data: Dict[str, Any]) -> "EventEnvelope":
+        """Rebuild an envelope from wire form without running any validation.
+
+        Only for messages read off canonical topics, which the publisher has
+        already validated. Nested values get the types validation would have
+        produced; a missing key or unknown enum value raises KeyError, nothing
+        else is checked.
+        """
+        return cls.model_construct(
+            event_id=data["eventId"],
+            event_type=data["eventType"],
+            event_version=data["eventVersion"],
+            source_system=_SOURCE_SYSTEMS[data["sourceSystem"]],
+            tenant_id=data["tenantId"],
+            entity_refs=[
+                EntityRef.model_construct(type=_ENTITY_TYPES[r["type"]], id=r["id"])
+                for r in data["entityRefs"]
+            ],
+            occurred_at=datetime.fromisoformat(data["occurredAt"]),
+            observed_at=datetime.fromisoformat(data["observedAt"]),
+            payload=data["payload"],
+            trace_id=data["traceId"],
+        )
+
     def to_wire(self) -> Dict[str, Any]:
         """The camelCase JSON-safe dict that goes on the topic."""
         return self.model_dump(by_alias=True, mode="json")
 
+    def to_wire_bytes(self) -> bytes:
+        """to_wire() already serialized, by pydantic's compiled encoder in one pass."""
+        return self.model_dump_json(by_alias=True).encode()
+
     @property
     def primary_entity(self) -> EntityRef:
         """First entity ref — used as the Kafka message key for partition ordering."""
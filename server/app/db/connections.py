@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Optional
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, TypeVar
 
 import asyncpg
 from neo4j import AsyncDriver, AsyncGraphDatabase
@@ -12,72 +14,297 @@ from core.config import (
     NEO4J_PASSWORD,
     NEO4J_URL,
     NEO4J_USER,
+    PG_MAX_INACTIVE,
+    PG_MAX_QUERIES,
+    PG_POOL_LOG_SECONDS,
+    PG_POOL_MAX,
+    PG_POOL_MIN,
+    PG_POOL_SAMPLE_SECONDS,
+    PG_STMT_CACHE_SIZE,
+    PG_USE_PGBOUNCER,
+    POSTGRES_READ_URL,
     POSTGRES_URL,
     TIMESCALE_URL,
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-async def _pool_with_retry(url: str, name: str, **kwargs: Any) -> asyncpg.Pool:
-    delay = 2.0
-    for attempt in range(6):
+
+class PoolTimeout(Exception):
+    """No pooled connection came free within acquire()'s timeout."""
+
+
+@asynccontextmanager
+async def acquire(
+    pool: asyncpg.Pool, timeout: Optional[float] = None
+) -> AsyncIterator[asyncpg.Connection]:
+    """pool.acquire() that cannot leak a connection when the caller gives up.
+
+    FastAPI cancels a request's task when the client disconnects, and a timeout
+    cancels the wait the same way. If either lands between the pool handing out
+    a connection and the caller receiving it, the connection is never released.
+    Shielding the acquire lets it finish; a caller that stopped waiting then
+    hands the connection straight back to the pool.
+
+    Running out of timeout raises PoolTimeout, so callers can tell an
+    exhausted pool apart from any other timeout.
+    """
+    acquiring = asyncio.ensure_future(pool.acquire())
+    deadline = asyncio.timeout(timeout)
+    try:
+        async with deadline:
+            conn = await asyncio.shield(acquiring)
+    except BaseException:
+        acquiring.add_done_callback(lambda f: _release_orphan(pool, f))
+        if deadline.expired():
+            raise PoolTimeout(f"no connection free in the pool within {timeout}s") from None
+        raise
+    try:
+        yield conn
+    finally:
+        await pool.release(conn)
+
+
+def _release_orphan(pool: asyncpg.Pool, acquired: asyncio.Future) -> None:
+    if not acquired.cancelled() and acquired.exception() is None:
+        asyncio.ensure_future(pool.release(acquired.result()))
+
+
+class BoundedPool:
+    """An asyncpg pool whose one-shot queries wait a bounded time for a connection.
+
+    Pool.fetch and friends acquire internally with no timeout, so on an
+    exhausted pool they queue forever. Here they go through acquire() instead
+    and raise PoolTimeout past `timeout`. Everything else (acquire, release,
+    sizes) is the wrapped pool's, so acquire(bounded, ...) works unchanged.
+    """
+
+    def __init__(self, pool: asyncpg.Pool, timeout: float) -> None:
+        self.pool = pool
+        self.timeout = timeout
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pool, name)
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> str:
+        async with acquire(self.pool, self.timeout) as conn:
+            return await conn.execute(query, *args, **kwargs)
+
+    async def executemany(self, query: str, args: Any, **kwargs: Any) -> None:
+        async with acquire(self.pool, self.timeout) as conn:
+            await conn.executemany(query, args, **kwargs)
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> List[asyncpg.Record]:
+        async with acquire(self.pool, self.timeout) as conn:
+            return await conn.fetch(query, *args, **kwargs)
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Optional[asyncpg.Record]:
+        async with acquire(self.pool, self.timeout) as conn:
+            return await conn.fetchrow(query, *args, **kwargs)
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        async with acquire(self.pool, self.timeout) as conn:
+            return await conn.fetchval(query, *args, **kwargs)
+
+
+async def _retry(
+    name: str,
+    fn: Callable[[], Awaitable[T]],
+    attempts: int = 6,
+    base: float = 2.0,
+    cap: float = 15.0,
+) -> T:
+    """Call fn until it succeeds, sleeping with decorrelated jitter between tries.
+
+    Each delay is drawn from [base, 3 * previous delay], capped. Replicas that
+    start together therefore spread their reconnects instead of retrying in
+    lockstep, while the worst-case wait stays bounded by cap.
+    """
+    delay = base
+    for attempt in range(attempts):
         try:
-            pool = await asyncpg.create_pool(url, min_size=1, max_size=10, **kwargs)
-            logger.info("%s pool ready", name)
-            return pool
+            return await fn()
         except Exception as e:
-            if attempt == 5:
+            if attempt == attempts - 1:
                 raise
-            logger.warning("%s not ready (%s); retrying in %.0fs", name, e, delay)
+            delay = min(cap, random.uniform(base, delay * 3))
+            logger.warning("%s not ready (%s); retrying in %.1fs", name, e, delay)
             await asyncio.sleep(delay)
-            delay = min(delay * 2, 15)
     raise RuntimeError("unreachable")
 
 
+async def _pool_with_retry(
+    url: str,
+    name: str,
+    min_size: int = PG_POOL_MIN,
+    max_size: int = PG_POOL_MAX,
+    **kwargs: Any,
+) -> asyncpg.Pool:
+    kwargs.setdefault("statement_cache_size", 0 if PG_USE_PGBOUNCER else PG_STMT_CACHE_SIZE)
+    kwargs.setdefault("max_queries", PG_MAX_QUERIES)
+    kwargs.setdefault("max_inactive_connection_lifetime", PG_MAX_INACTIVE)
+
+    # create_pool opens and initializes min_size connections before it returns,
+    # so the pool needs no separate warm-up.
+    pool = await _retry(
+        name, lambda: asyncpg.create_pool(url, min_size=min_size, max_size=max_size, **kwargs)
+    )
+    logger.info("%s pool ready", name)
+    return pool
+
+
+async def _neo4j_with_retry() -> AsyncDriver:
+    driver = AsyncGraphDatabase.driver(NEO4J_URL, auth=(NEO4J_USER, NEO4J_PASSWORD))
+
+    async def verify() -> None:
+        await driver.verify_connectivity()
+        async with driver.session() as session:
+            # Warm the bolt connection and the server's query caches.
+            await (await session.run("RETURN 1")).consume()
+
+    try:
+        await _retry("neo4j", verify)
+    except BaseException:
+        await driver.close()
+        raise
+    logger.info("neo4j driver ready")
+    return driver
+
+
 class Databases:
-    """Lazily-initialized connection holder shared within a process."""
+    """Lazily-initialized connection holder shared within a process.
+
+    Each connect_* is double-checked under its own lock, so a burst of
+    concurrent first callers creates exactly one pool (or driver) per store.
+    """
 
     def __init__(self) -> None:
         self.pg: Optional[asyncpg.Pool] = None
+        self.pg_read: Optional[asyncpg.Pool] = None
         self.ts: Optional[asyncpg.Pool] = None
         self.neo4j: Optional[AsyncDriver] = None
+        self._monitor: Optional[asyncio.Task] = None
+        self._peak_in_use: Dict[str, int] = {}
+        self._reset_locks()
+
+    def _reset_locks(self) -> None:
+        # Workers restart by running a new event loop; fresh locks per run
+        # keep them from being bound to a loop that no longer exists.
+        self._pg_lock = asyncio.Lock()
+        self._pg_read_lock = asyncio.Lock()
+        self._ts_lock = asyncio.Lock()
+        self._neo4j_lock = asyncio.Lock()
 
     async def connect_postgres(self) -> asyncpg.Pool:
         if self.pg is None:
-            self.pg = await _pool_with_retry(POSTGRES_URL, "postgres")
+            async with self._pg_lock:
+                if self.pg is None:
+                    self.pg = await _pool_with_retry(POSTGRES_URL, "postgres")
         return self.pg
 
+    async def connect_postgres_read(self) -> asyncpg.Pool:
+        """Pool for read-only requests: the replica if configured, else the primary."""
+        if POSTGRES_READ_URL is None:
+            return await self.connect_postgres()
+        if self.pg_read is None:
+            async with self._pg_read_lock:
+                if self.pg_read is None:
+                    self.pg_read = await _pool_with_retry(
+                        POSTGRES_READ_URL,
+                        "postgres-read",
+                        server_settings={"default_transaction_read_only": "on"},
+                    )
+        return self.pg_read
+
     async def connect_timescale(self) -> asyncpg.Pool:
         if self.ts is None:
-            self.ts = await _pool_with_retry(TIMESCALE_URL, "timescale")
+            async with self._ts_lock:
+                if self.ts is None:
+                    self.ts = await _pool_with_retry(TIMESCALE_URL, "timescale")
         return self.ts
 
     async def connect_neo4j(self) -> AsyncDriver:
         if self.neo4j is None:
-            driver = AsyncGraphDatabase.driver(NEO4J_URL, auth=(NEO4J_USER, NEO4J_PASSWORD))
-            delay = 2.0
-            for attempt in range(6):
-                try:
-                    await driver.verify_connectivity()
-                    break
-                except Exception as e:
-                    if attempt == 5:
-                        raise
-                    logger.warning("neo4j not ready (%s); retrying in %.0fs", e, delay)
-                    await asyncio.sleep(delay)
-                    delay = min(delay * 2, 15)
-            self.neo4j = driver
-            logger.info("neo4j driver ready")
+            async with self._neo4j_lock:
+                if self.neo4j is None:
+                    self.neo4j = await _neo4j_with_retry()
         return self.neo4j
 
+    async def connect_all(self) -> None:
+        """Connect all three stores concurrently.
+
+        Each store has its own retry loop; running them side by side means a
+        cold start waits for the slowest store rather than the sum of all three.
+        """
+        results = await asyncio.gather(
+            self.connect_postgres(),
+            self.connect_timescale(),
+            self.connect_neo4j(),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise errors[0]
+
+    def start_pool_monitor(self) -> None:
+        """Sample pool usage in the background — the input for tuning PG_POOL_*.
+
+        Rule of thumb: if peakInUse stays well under max, lower PG_POOL_MAX; if
+        it hits max while the database still has CPU headroom, raise it.
+        """
+        if self._monitor is None:
+            self._monitor = asyncio.create_task(self._sample_pools())
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Current size/idle/in-use per asyncpg pool, plus peak in-use since start."""
+        stats: Dict[str, Dict[str, int]] = {}
+        pools = (("postgres", self.pg), ("postgres-read", self.pg_read), ("timescale", self.ts))
+        for name, pool in pools:
+            if pool is None:
+                continue
+            size, idle = pool.get_size(), pool.get_idle_size()
+            in_use = size - idle
+            peak = self._peak_in_use[name] = max(self._peak_in_use.get(name, 0), in_use)
+            stats[name] = {
+                "size": size,
+                "idle": idle,
+                "inUse": in_use,
+                "peakInUse": peak,
+                "min": pool.get_min_size(),
+                "max": pool.get_max_size(),
+            }
+        return stats
+
+    async def _sample_pools(self) -> None:
+        since_log = 0.0
+        while True:
+            await asyncio.sleep(PG_POOL_SAMPLE_SECONDS)
+            stats = self.pool_stats()
+            since_log += PG_POOL_SAMPLE_SECONDS
+            if since_log >= PG_POOL_LOG_SECONDS:
+                since_log = 0.0
+                for name, st in stats.items():
+                    logger.info(
+                        "%s pool: size=%d idle=%d in_use=%d peak=%d max=%d",
+                        name, st["size"], st["idle"], st["inUse"], st["peakInUse"], st["max"],
+                    )
+
     async def close(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            self._monitor = None
         if self.pg:
             await self.pg.close()
+        if self.pg_read:
+            await self.pg_read.close()
         if self.ts:
             await self.ts.close()
         if self.neo4j:
             await self.neo4j.close()
+        self.pg = self.pg_read = self.ts = self.neo4j = None
+        self._reset_locks()
 
 
 databases = Databases()
@@ -8,72 +8,87 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Iterable, List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, List, Optional
 
 from aiokafka.admin import AIOKafkaAdminClient, NewTopic
-from aiokafka.errors import KafkaError, TopicAlreadyExistsError, UnknownTopicOrPartitionError
+from aiokafka.errors import (
+    KafkaError,
+    TopicAlreadyExistsError,
+    UnknownTopicOrPartitionError,
+    for_code,
+)
 
 from core.catalog import CANONICAL_TOPICS
-from core.config import KAFKA_BOOTSTRAP_SERVERS
+from core.config import KAFKA_BOOTSTRAP_SERVERS, KAFKA_TOPIC_PARTITIONS
 
 logger = logging.getLogger(__name__)
 
-PARTITIONS = 3
+PARTITIONS = KAFKA_TOPIC_PARTITIONS
 REPLICATION = 1
 
 
-async def _admin() -> AIOKafkaAdminClient:
+@asynccontextmanager
+async def _admin(
+    client: Optional[AIOKafkaAdminClient] = None,
+) -> AsyncIterator[AIOKafkaAdminClient]:
+    """Use the caller's admin client, or start a short-lived one just for this call."""
+    if client is not None:
+        yield client
+        return
     client = AIOKafkaAdminClient(bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS)
     await client.start()
-    return client
+    try:
+        yield client
+    finally:
+        await client.close()
 
 
-async def create_canonical_topics() -> List[str]:
-    """Idempotently create all lip.* topics. Returns the ones newly created."""
-    client = await _admin()
+async def create_canonical_topics(client: Optional[AIOKafkaAdminClient] = None) -> List[str]:
+    """Idempotently create all lip.* topics. Returns the ones newly created.
+
+    One CreateTopics request covers the whole namespace; the broker answers
+    per topic, and "already exists" counts as success. That makes the common
+    nothing-to-do path a single round trip with no list_topics beforehand.
+    """
     created: List[str] = []
-    try:
-        existing = set(await client.list_topics())
-        missing = [t for t in CANONICAL_TOPICS if t not in existing]
-        for topic in missing:
-            try:
-                await client.create_topics(
-                    [NewTopic(name=topic, num_partitions=PARTITIONS, replication_factor=REPLICATION)]
-                )
+    async with _admin(client) as admin:
+        response = await admin.create_topics(
+            [
+                NewTopic(name=topic, num_partitions=PARTITIONS, replication_factor=REPLICATION)
+                for topic in CANONICAL_TOPICS
+            ]
+        )
+        for topic, code, *_ in response.topic_errors:
+            if code == 0:
                 created.append(topic)
-            except TopicAlreadyExistsError:
-                pass
+            elif code != TopicAlreadyExistsError.errno:
+                raise for_code(code)(f"could not create {topic}")
         if created:
             logger.info("created topics: %s", created)
         else:
             logger.info("all %d canonical topics already exist", len(CANONICAL_TOPICS))
-    finally:
-        await client.close()
     return created
 
 
-async def delete_topics(topics: Iterable[str]) -> None:
-    client = await _admin()
-    try:
-        existing = set(await client.list_topics())
+async def delete_topics(
+    topics: Iterable[str], client: Optional[AIOKafkaAdminClient] = None
+) -> None:
+    async with _admin(client) as admin:
+        existing = set(await admin.list_topics())
         doomed = [t for t in topics if t in existing]
         if doomed:
             try:
-                await client.delete_topics(doomed)
+                await admin.delete_topics(doomed)
             except UnknownTopicOrPartitionError:
                 pass
             logger.info("deleted topics: %s", doomed)
-    finally:
-        await client.close()
 
 
-async def list_canonical_topics() -> List[str]:
+async def list_canonical_topics(client: Optional[AIOKafkaAdminClient] = None) -> List[str]:
     """Every topic currently in the canonical (lip.*) namespace."""
-    client = await _admin()
-    try:
-        all_topics = await client.list_topics()
-    finally:
-        await client.close()
+    async with _admin(client) as admin:
+        all_topics = await admin.list_topics()
     return sorted(t for t in all_topics if t.startswith("lip."))
 
 
@@ -83,24 +98,28 @@ async def reset_canonical_topics() -> None:
     The raw CDC inbox (cdc.raw.*) is deliberately left alone: deleting a live
     Debezium connector's topics wedges its producer. The inbox is source
     material, not canonical state — the canonical backbone is what resets.
+
+    One admin client serves the whole reset, so the delete, the polling and
+    the recreate retries share a single connection and metadata handshake.
     """
-    doomed = await list_canonical_topics()
-    await delete_topics(doomed)
-
-    # Topic deletion is asynchronous on the broker; poll until the namespace is gone.
-    for _ in range(30):
-        remaining = await list_canonical_topics()
-        if not remaining:
-            break
-        await asyncio.sleep(1)
-
-    # Give the controller a beat, then recreate. Retries cover the window where
-    # a deleted topic name is still being cleaned up.
-    for attempt in range(10):
-        try:
-            await create_canonical_topics()
-            return
-        except KafkaError as e:
-            logger.warning("topic recreate attempt %d failed: %s", attempt + 1, e)
-            await asyncio.sleep(2)
+    async with _admin() as admin:
+        doomed = await list_canonical_topics(admin)
+        await delete_topics(doomed, admin)
+
+        # Topic deletion is asynchronous on the broker; poll until the namespace is gone.
+        for _ in range(30):
+            remaining = await list_canonical_topics(admin)
+            if not remaining:
+                break
+            await asyncio.sleep(1)
+
+        # Give the controller a beat, then recreate. Retries cover the window where
+        # a deleted topic name is still being cleaned up.
+        for attempt in range(10):
+            try:
+                await create_canonical_topics(admin)
+                return
+            except KafkaError as e:
+                logger.warning("topic recreate attempt %d failed: %s", attempt + 1, e)
+                await asyncio.sleep(2)
     raise RuntimeError("could not recreate canonical topics after reset")
@@ -0,0 +1,49 @@
+"""Wire codecs for canonical envelopes.
+
+JSON is the format on every lip.* topic unless the topic is listed in
+EVENTBUS_MSGPACK_TOPICS, in which case the publisher packs the same wire dict
+with MessagePack: smaller and quicker to encode and decode for repetitive,
+high-volume envelopes. Every MessagePack message carries a contentType header,
+so readers choose a decoder per message rather than per topic and a topic can
+switch format without stranding what is already on it.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import msgpack
+import orjson
+
+from core.config import EVENTBUS_MSGPACK_TOPICS
+from core.envelope import EventEnvelope
+
+CONTENT_TYPE = "contentType"
+MSGPACK = b"application/msgpack"
+MSGPACK_HEADER = (CONTENT_TYPE, MSGPACK)
+
+Headers = Iterable[Tuple[str, bytes]]
+
+
+def encode(envelope: EventEnvelope, topic: str) -> Tuple[bytes, Optional[Tuple[str, bytes]]]:
+    """Serialize an envelope for its topic. Returns (value, extra header or None)."""
+    if topic in EVENTBUS_MSGPACK_TOPICS:
+        return msgpack.packb(envelope.to_wire()), MSGPACK_HEADER
+    return envelope.to_wire_bytes(), None
+
+
+def is_msgpack(headers: Optional[Headers]) -> bool:
+    return any(k == CONTENT_TYPE and v == MSGPACK for k, v in headers or ())
+
+
+def decode(raw: bytes, headers: Optional[Headers] = None) -> Dict[str, Any]:
+    """Message value -> wire dict. Raises ValueError on undecodable bytes."""
+    if is_msgpack(headers):
+        return msgpack.unpackb(raw)
+    return orjson.loads(raw)
+
+
+def to_json_bytes(raw: bytes, headers: Optional[Headers] = None) -> bytes:
+    """The message as UTF-8 JSON, transcoding only when it is not JSON already."""
+    if is_msgpack(headers):
+        return orjson.dumps(msgpack.unpackb(raw))
+    return raw
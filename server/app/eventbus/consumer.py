@@ -1,28 +1,53 @@
 """Canonical event consumer helper.
 
 Wraps AIOKafkaConsumer so every consumer in the system (projector, websocket
-bridge) parses messages the same way: JSON -> EventEnvelope, with poison-pill
-protection (a message that fails to parse is logged and skipped, never crashes
-the consumer loop).
+bridge) is configured the same way, and every envelope reader parses messages
+the same way: JSON -> EventEnvelope, with poison-pill protection (a message
+that fails to parse is logged and skipped, never crashes the consumer loop).
+Values stay raw bytes until parse_envelope hands them to eventbus.codec, which
+reads bytes directly (orjson, or msgpack when the contentType header says so)
+— no UTF-8 decode step per message.
+
+Envelopes are rebuilt without pydantic validation (EventEnvelope.
+from_trusted_wire): the publisher validated them on the way in. Set
+EVENTBUS_VALIDATE_ON_CONSUME to validate again on read; `make audit` is the
+end-to-end conformance check either way.
 
 metadata_max_age_ms is kept low so consumers re-discover topics quickly after a
 demo reset deletes and recreates them.
 """
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from typing import AsyncIterator, List, Optional, Tuple
+from concurrent.futures import Executor
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 
 from aiokafka import AIOKafkaConsumer
-from pydantic import ValidationError
 
-from core.config import KAFKA_BOOTSTRAP_SERVERS
+from core.config import (
+    EVENTBUS_VALIDATE_ON_CONSUME,
+    KAFKA_BOOTSTRAP_SERVERS,
+    KAFKA_FETCH_MAX_WAIT_MS,
+    KAFKA_FETCH_MIN_BYTES,
+    KAFKA_MAX_PARTITION_FETCH_BYTES,
+    KAFKA_MAX_POLL_RECORDS,
+)
 from core.envelope import EventEnvelope
+from eventbus import codec
 
 logger = logging.getLogger(__name__)
 
 
+# Shared by every consumer in the system, including the normalizer's raw one.
+FETCH_TUNING = dict(
+    fetch_min_bytes=KAFKA_FETCH_MIN_BYTES,
+    fetch_max_wait_ms=KAFKA_FETCH_MAX_WAIT_MS,
+    max_partition_fetch_bytes=KAFKA_MAX_PARTITION_FETCH_BYTES,
+    max_poll_records=KAFKA_MAX_POLL_RECORDS,
+)
+
+
 def build_consumer(
     topics: List[str],
     group_id: Optional[str],
@@ -35,28 +60,62 @@ def build_consumer(
         *topics,
         bootstrap_servers=bootstrap_servers,
         group_id=group_id,
-        value_deserializer=lambda m: m,  # raw bytes; parsed in envelopes()
+        value_deserializer=lambda m: m,  # raw bytes; parsed in parse_envelope()
         key_deserializer=lambda k: k.decode("utf-8") if k else None,
         auto_offset_reset="earliest" if from_beginning else "latest",
         enable_auto_commit=group_id is not None,
         metadata_max_age_ms=5000,
+        **FETCH_TUNING,
     )
 
 
-def parse_envelope(raw: bytes) -> Optional[EventEnvelope]:
+def parse_envelope(
+    raw: bytes, headers: Optional[codec.Headers] = None
+) -> Optional[EventEnvelope]:
     """Parse one Kafka message value into an EventEnvelope, or None if malformed."""
     try:
-        return EventEnvelope.model_validate(json.loads(raw))
-    except (json.JSONDecodeError, UnicodeDecodeError, ValidationError) as e:
+        data = codec.decode(raw, headers)
+        if EVENTBUS_VALIDATE_ON_CONSUME:
+            return EventEnvelope.model_validate(data)
+        return EventEnvelope.from_trusted_wire(data)
+    # ValueError covers orjson and msgpack decode errors and ValidationError;
+    # KeyError and TypeError are a trusted parse meeting the wrong shape.
+    except (KeyError, TypeError, ValueError) as e:
         logger.warning("skipping non-canonical message: %s", e)
         return None
 
 
-async def envelopes(
+def parse_envelopes(
+    messages: List[Tuple[bytes, Sequence[Tuple[str, bytes]]]],
+) -> List[Optional[EventEnvelope]]:
+    """parse_envelope over a batch of (value, headers). Module-level so a
+    process pool can run it."""
+    return [parse_envelope(raw, headers) for raw, headers in messages]
+
+
+async def envelope_batches(
     consumer: AIOKafkaConsumer,
-) -> AsyncIterator[Tuple[str, EventEnvelope]]:
-    """Yield (topic, envelope) for every parseable message, skipping bad ones."""
-    async for message in consumer:
-        envelope = parse_envelope(message.value)
-        if envelope is not None:
-            yield message.topic, envelope
+    timeout_ms: int = 500,
+    max_records: int = 500,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[List[Tuple[str, EventEnvelope]]]:
+    """Yield lists of (topic, envelope) per getmany() poll, skipping bad messages.
+
+    Order is preserved within each partition. Empty polls yield nothing, so a
+    quiet backbone costs one wake-up per timeout_ms. With an executor, each
+    poll is parsed there in one call while the loop keeps serving other tasks.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        polled = await consumer.getmany(timeout_ms=timeout_ms, max_records=max_records)
+        messages = [m for part in polled.values() for m in part]
+        if not messages:
+            continue
+        raws = [(m.value, m.headers) for m in messages]
+        if executor is None:
+            parsed = parse_envelopes(raws)
+        else:
+            parsed = await loop.run_in_executor(executor, parse_envelopes, raws)
+        batch = [(m.topic, e) for m, e in zip(messages, parsed) if e is not None]
+        if batch:
+            yield batch
@@ -13,20 +13,32 @@ consumer can trust that anything on a canonical topic parses as envelope v1.
 """
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from aiokafka import AIOKafkaProducer
+from aiokafka.errors import KafkaError
 from pydantic import ValidationError
 
 from core import catalog
-from core.config import KAFKA_BOOTSTRAP_SERVERS, TENANT_ID
+from core.config import (
+    KAFKA_ACKS,
+    KAFKA_BOOTSTRAP_SERVERS,
+    KAFKA_COMPRESSION_TYPE,
+    KAFKA_ENABLE_IDEMPOTENCE,
+    KAFKA_LINGER_MS,
+    KAFKA_MAX_BATCH_SIZE,
+    TENANT_ID,
+)
 from core.envelope import EntityRef, EventEnvelope, SourceSystem
+from eventbus import codec
 
 logger = logging.getLogger(__name__)
 
+METADATA_WARM_TIMEOUT_S = 5
+
 
 class EventValidationError(Exception):
     """Raised when an event fails envelope or payload validation. Not published."""
@@ -83,24 +95,63 @@ def build_envelope(
         )
 
 
+# Header pairs that repeat on every message, built once and shared by every
+# headers list. Only registered event types can be published, so the catalog
+# bounds the first map.
+_EVENT_TYPE_HEADERS: Dict[str, Tuple[str, bytes]] = {
+    name: ("eventType", name.encode()) for name in catalog.CATALOG
+}
+_TENANT_HEADER = ("tenantId", TENANT_ID.encode())
+
+
+async def _warm_metadata(producer: AIOKafkaProducer) -> None:
+    """Fetch partition metadata for every canonical topic up front.
+
+    Otherwise the first send to each topic stalls on a metadata round trip.
+    Best effort: a topic that does not exist yet (kafka-init still running, or
+    mid demo reset) is looked up again on its first send as usual.
+    """
+    try:
+        async with asyncio.timeout(METADATA_WARM_TIMEOUT_S):
+            await asyncio.gather(*(producer.partitions_for(t) for t in catalog.CANONICAL_TOPICS))
+    except (KafkaError, TimeoutError) as e:
+        logger.warning("could not prefetch topic metadata (%r); continuing", e)
+
+
 class EventPublisher:
     """Async Kafka producer that only speaks envelope v1."""
 
-    def __init__(self, bootstrap_servers: str = KAFKA_BOOTSTRAP_SERVERS):
+    def __init__(
+        self,
+        bootstrap_servers: str = KAFKA_BOOTSTRAP_SERVERS,
+        acks: Union[int, str] = KAFKA_ACKS,
+        linger_ms: int = KAFKA_LINGER_MS,
+        max_batch_size: int = KAFKA_MAX_BATCH_SIZE,
+    ):
         self.bootstrap_servers = bootstrap_servers
+        self.acks = acks
+        self.linger_ms = linger_ms
+        self.max_batch_size = max_batch_size
         self._producer: Optional[AIOKafkaProducer] = None
+        self._in_flight: Set["asyncio.Future[Any]"] = set()
+        self._delivery_error: Optional[BaseException] = None
 
     async def start(self) -> None:
         if self._producer is not None:
             return
         self._producer = AIOKafkaProducer(
             bootstrap_servers=self.bootstrap_servers,
-            value_serializer=lambda v: json.dumps(v).encode("utf-8"),
             key_serializer=lambda k: k.encode("utf-8") if k else None,
-            acks="all",
-            linger_ms=5,
+            acks=self.acks,
+            enable_idempotence=KAFKA_ENABLE_IDEMPOTENCE and self.acks in ("all", -1),
+            # Compression runs per batch; lingering a little gives it whole
+            # batches to work on instead of single envelopes.
+            compression_type=KAFKA_COMPRESSION_TYPE,
+            linger_ms=self.linger_ms,
+            max_batch_size=self.max_batch_size,
         )
         await self._producer.start()
+        await _warm_metadata(self._producer)
         logger.info("EventPublisher connected to %s", self.bootstrap_servers)
 
     async def stop(self) -> None:
@@ -108,29 +159,81 @@ class EventPublisher:
             await self._producer.stop()
             self._producer = None
 
-    async def publish(self, envelope: EventEnvelope) -> None:
-        """Publish a validated envelope to its catalog topic.
+    async def _enqueue(self, envelope: EventEnvelope) -> "asyncio.Future[Any]":
+        """Hand a validated envelope to the producer and return its delivery future.
 
         Keyed by the primary entity id so all events about one entity stay
-        ordered within a partition.
+        ordered within a partition. The future resolves once the broker has
+        acknowledged the batch the envelope went out in.
         """
         if self._producer is None:
             raise RuntimeError("EventPublisher not started")
 
         topic = catalog.topic_for(envelope.event_type)
         headers = [
-            ("eventType", envelope.event_type.encode()),
+            _EVENT_TYPE_HEADERS[envelope.event_type],
             ("eventId", envelope.event_id.encode()),
             ("traceId", envelope.trace_id.encode()),
-            ("tenantId", envelope.tenant_id.encode()),
+            _TENANT_HEADER
+            if envelope.tenant_id == TENANT_ID
+            else ("tenantId", envelope.tenant_id.encode()),
         ]
-        await self._producer.send_and_wait(
+        value, codec_header = codec.encode(envelope, topic)
+        if codec_header is not None:
+            headers.append(codec_header)
+        return await self._producer.send(
             topic,
-            value=envelope.to_wire(),
+            value=value,
             key=envelope.primary_entity.id,
             headers=headers,
         )
-        logger.debug("published %s -> %s", envelope.event_type, topic)
+
+    async def publish(self, envelope: EventEnvelope, wait: bool = True) -> None:
+        """Publish a validated envelope to its catalog topic.
+
+        With wait=True this returns once the broker has acked the envelope. With
+        wait=False it returns as soon as the envelope is enqueued; the ack is
+        settled in the background and any failure surfaces from flush().
+        """
+        delivery = await self._enqueue(envelope)
+        if wait:
+            await delivery
+            return
+        self._in_flight.add(delivery)
+        delivery.add_done_callback(self._settle)
+
+    def _settle(self, delivery: "asyncio.Future[Any]") -> None:
+        self._in_flight.discard(delivery)
+        if delivery.cancelled():
+            return
+        error = delivery.exception()
+        if error is not None:
+            logger.error("event delivery failed: %s", error)
+            if self._delivery_error is None:
+                self._delivery_error = error
+
+    async def flush(self) -> None:
+        """Wait for every publish(wait=False) so far to be acked.
+
+        Raises the first delivery error seen since the previous flush, so a
+        caller that commits offsets after flushing never commits past a loss.
+        """
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        error, self._delivery_error = self._delivery_error, None
+        if error is not None:
+            raise error
+
+    async def publish_many(self, envelopes: List[EventEnvelope]) -> None:
+        """Publish envelopes in order, then wait for all of their acks together.
+
+        Everything is enqueued before any ack is awaited, so the producer packs
+        the envelopes into shared batches: one broker round trip per batch
+        rather than one per event. Raises the first delivery error, if any.
+        """
+        futures = [await self._enqueue(e) for e in envelopes]
+        await asyncio.gather(*futures)
+        logger.debug("published %d envelopes", len(futures))
 
     async def emit(
         self,
@@ -140,6 +243,7 @@ class EventPublisher:
         payload: Dict[str, Any],
         occurred_at: Optional[datetime] = None,
         trace_id: Optional[str] = None,
+        wait: bool = True,
     ) -> EventEnvelope:
         """build_envelope + publish in one call. Returns the envelope that was sent."""
         envelope = build_envelope(
@@ -150,17 +254,34 @@ class EventPublisher:
             occurred_at=occurred_at,
             trace_id=trace_id,
         )
-        await self.publish(envelope)
+        await self.publish(envelope, wait=wait)
         return envelope
 
 
 _publisher: Optional[EventPublisher] = None
+_publisher_lock = asyncio.Lock()
 
 
 async def get_publisher() -> EventPublisher:
-    """Process-wide publisher singleton."""
+    """Process-wide publisher singleton.
+
+    Double-checked under a lock so a burst of concurrent first callers starts
+    one producer; after that, callers return without touching the lock. The
+    singleton is only published once start() succeeds.
+    """
     global _publisher
     if _publisher is None:
-        _publisher = EventPublisher()
-        await _publisher.start()
+        async with _publisher_lock:
+            if _publisher is None:
+                publisher = EventPublisher()
+                await publisher.start()
+                _publisher = publisher
     return _publisher
+
+
+async def close_publisher() -> None:
+    """Stop the singleton if it was ever started; never creates one."""
+    global _publisher
+    if _publisher is not None:
+        await _publisher.stop()
+        _publisher = None
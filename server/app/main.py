@@ -10,11 +10,14 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
-from db.connections import databases
-from eventbus.publisher import get_publisher
+from core.config import API_GZIP_MIN_BYTES
+from db.connections import PoolTimeout, databases
+from eventbus.publisher import close_publisher, get_publisher
 from routers import analytics, customers, drivers, events_api, graph, health, orders, routes_api, stops, vehicles, ws
 from services.wsbus import pump_events_to_websockets
 
@@ -24,14 +27,27 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _pump_stopped(task: asyncio.Task) -> None:
+    # The pump reconnects on its own errors; anything that still ends it would
+    # otherwise only surface at shutdown, when the task is finally awaited.
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("ws bridge stopped: %r", task.exception())
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("LIP API starting")
-    await databases.connect_postgres()
-    await databases.connect_timescale()
-    await databases.connect_neo4j()
+    # Eager tasks run inline until their first real suspension, so work that
+    # completes without blocking (a websocket send into a free buffer, a
+    # background task that only enqueues) skips a trip through the loop.
+    if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    await databases.connect_all()
+    await databases.connect_postgres_read()
+    databases.start_pool_monitor()
     await get_publisher()
     ws_pump = asyncio.create_task(pump_events_to_websockets())
+    ws_pump.add_done_callback(_pump_stopped)
     logger.info("LIP API ready")
     yield
     ws_pump.cancel()
@@ -40,8 +56,7 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
     await databases.close()
-    publisher = await get_publisher()
-    await publisher.stop()
+    await close_publisher()
     logger.info("LIP API stopped")
 
 
@@ -50,6 +65,9 @@ app = FastAPI(
     description="Logistics Intelligence Platform proof-of-concept — canonical event backbone demo",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson renders response bodies straight to bytes, several times faster
+    # than the stdlib encoder on the list endpoints.
+    default_response_class=ORJSONResponse,
 )
 
 # The UI is served same-origin through nginx in Docker; CORS covers local dev
@@ -62,6 +80,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if API_GZIP_MIN_BYTES > 0:
+    # Only bodies past the threshold are worth the compression CPU; the
+    # analytics, order and event-tail lists are the ones that get there.
+    app.add_middleware(GZipMiddleware, minimum_size=API_GZIP_MIN_BYTES)
+
+
+@app.exception_handler(PoolTimeout)
+async def pool_timeout_handler(request: Request, exc: PoolTimeout) -> ORJSONResponse:
+    # Raised by db.connections.acquire when the pool has no connection to spare
+    # within PG_ACQUIRE_TIMEOUT: tell the client to back off rather than hang.
+    # Other timeouts (slow queries, Neo4j, Kafka) stay ordinary errors.
+    return ORJSONResponse({"detail": "service busy, retry shortly"}, status_code=503)
+
+
 for r in (health, orders, routes_api, stops, drivers, vehicles, customers, events_api, analytics, graph):
     app.include_router(r.router, prefix="/api")
 app.include_router(ws.router)
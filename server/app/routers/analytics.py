@@ -1,95 +1,93 @@
 """Analytics endpoints — honest aggregates over the world model and event log."""
 from __future__ import annotations
 
+import asyncio
+
+import orjson
 from fastapi import APIRouter, Depends
 
-from routers.deps import get_pg, get_ts
+from routers.deps import get_pg_read, get_ts
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 
+# Every world-model count the dashboard shows, as one statement: each table's
+# aggregate row comes back as a jsonb column, so the summary costs a single
+# Postgres round trip.
+SUMMARY_QUERY = """
+SELECT
+  (SELECT to_jsonb(t) FROM (
+     SELECT COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE status = 'CREATED')     AS created,
+            COUNT(*) FILTER (WHERE status = 'ASSIGNED')    AS assigned,
+            COUNT(*) FILTER (WHERE status = 'IN_PROGRESS') AS in_progress,
+            COUNT(*) FILTER (WHERE status = 'COMPLETED')   AS completed,
+            COUNT(*) FILTER (WHERE status = 'CANCELLED')   AS cancelled
+     FROM orders) t) AS orders,
+  (SELECT to_jsonb(t) FROM (
+     SELECT COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE status = 'COMPLETED') AS completed,
+            COUNT(*) FILTER (WHERE status = 'COMPLETED'
+                             AND completed_at <= window_end) AS completed_in_window
+     FROM stops) t) AS stops,
+  (SELECT to_jsonb(t) FROM (
+     SELECT COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE status = 'PLANNED')   AS planned,
+            COUNT(*) FILTER (WHERE status = 'ACTIVE')    AS active,
+            COUNT(*) FILTER (WHERE status = 'COMPLETED') AS completed
+     FROM routes) t) AS routes,
+  (SELECT to_jsonb(t) FROM (
+     SELECT COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE status = 'AVAILABLE') AS available,
+            COUNT(*) FILTER (WHERE status = 'ON_ROUTE')  AS on_route,
+            COUNT(*) FILTER (WHERE status = 'OFF_DUTY')  AS off_duty
+     FROM drivers) t) AS drivers,
+  (SELECT to_jsonb(t) FROM (
+     SELECT COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE status = 'AVAILABLE')   AS available,
+            COUNT(*) FILTER (WHERE status = 'IN_SERVICE')  AS in_service,
+            COUNT(*) FILTER (WHERE status = 'MAINTENANCE') AS maintenance
+     FROM vehicles) t) AS vehicles,
+  (SELECT to_jsonb(t) FROM (
+     SELECT COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE status = 'DELIVERED') AS delivered
+     FROM parcels) t) AS parcels
+"""
+
+# Event counts come from the event_counts_1m continuous aggregate (see
+# database/timescale/init.sql): an hour is at most 60 buckets per type, where
+# the raw event_stream holds every event ever projected.
+EVENTS_LAST_HOUR_QUERY = """
+SELECT COALESCE(SUM(count), 0)::bigint
+FROM event_counts_1m
+WHERE bucket > NOW() - INTERVAL '1 hour'
+"""
+
+
 @router.get("/summary")
-async def summary(pg=Depends(get_pg), ts=Depends(get_ts)):
-    orders = await pg.fetchrow(
-        """
-        SELECT COUNT(*) AS total,
-               COUNT(*) FILTER (WHERE status = 'CREATED')     AS created,
-               COUNT(*) FILTER (WHERE status = 'ASSIGNED')    AS assigned,
-               COUNT(*) FILTER (WHERE status = 'IN_PROGRESS') AS in_progress,
-               COUNT(*) FILTER (WHERE status = 'COMPLETED')   AS completed,
-               COUNT(*) FILTER (WHERE status = 'CANCELLED')   AS cancelled
-        FROM orders
-        """
-    )
-    stops = await pg.fetchrow(
-        """
-        SELECT COUNT(*) AS total,
-               COUNT(*) FILTER (WHERE status = 'COMPLETED') AS completed,
-               COUNT(*) FILTER (WHERE status = 'COMPLETED'
-                                AND completed_at <= window_end) AS completed_in_window
-        FROM stops
-        """
-    )
-    routes = await pg.fetchrow(
-        """
-        SELECT COUNT(*) AS total,
-               COUNT(*) FILTER (WHERE status = 'PLANNED')   AS planned,
-               COUNT(*) FILTER (WHERE status = 'ACTIVE')    AS active,
-               COUNT(*) FILTER (WHERE status = 'COMPLETED') AS completed
-        FROM routes
-        """
-    )
-    drivers = await pg.fetchrow(
-        """
-        SELECT COUNT(*) AS total,
-               COUNT(*) FILTER (WHERE status = 'AVAILABLE') AS available,
-               COUNT(*) FILTER (WHERE status = 'ON_ROUTE')  AS on_route,
-               COUNT(*) FILTER (WHERE status = 'OFF_DUTY')  AS off_duty
-        FROM drivers
-        """
-    )
-    vehicles = await pg.fetchrow(
-        """
-        SELECT COUNT(*) AS total,
-               COUNT(*) FILTER (WHERE status = 'AVAILABLE')   AS available,
-               COUNT(*) FILTER (WHERE status = 'IN_SERVICE')  AS in_service,
-               COUNT(*) FILTER (WHERE status = 'MAINTENANCE') AS maintenance
-        FROM vehicles
-        """
-    )
-    parcels = await pg.fetchrow(
-        """
-        SELECT COUNT(*) AS total,
-               COUNT(*) FILTER (WHERE status = 'DELIVERED') AS delivered
-        FROM parcels
-        """
-    )
-    events_last_hour = await ts.fetchval(
-        "SELECT COUNT(*) FROM event_stream WHERE time > NOW() - INTERVAL '1 hour'"
+async def summary(pg=Depends(get_pg_read), ts=Depends(get_ts)):
+    # Different databases, so the two queries run side by side.
+    counts, events_last_hour = await asyncio.gather(
+        pg.fetchrow(SUMMARY_QUERY), ts.fetchval(EVENTS_LAST_HOUR_QUERY)
     )
+    result = {name: orjson.loads(counts[name]) for name in counts.keys()}
 
+    stops = result["stops"]
     completed = stops["completed"] or 0
     in_window = stops["completed_in_window"] or 0
-    on_time_pct = round(100.0 * in_window / completed, 1) if completed else None
+    stops["onTimePercentage"] = round(100.0 * in_window / completed, 1) if completed else None
 
-    return {
-        "orders": dict(orders),
-        "stops": {**dict(stops), "onTimePercentage": on_time_pct},
-        "routes": dict(routes),
-        "drivers": dict(drivers),
-        "vehicles": dict(vehicles),
-        "parcels": dict(parcels),
-        "eventsLastHour": events_last_hour,
-    }
+    result["eventsLastHour"] = events_last_hour
+    return result
 
 
 @router.get("/events-by-type")
 async def events_by_type(hours: int = 24, ts=Depends(get_ts)):
     rows = await ts.fetch(
         """
-        SELECT event_type, source_system, COUNT(*) AS count
-        FROM event_stream
-        WHERE time > NOW() - make_interval(hours => $1)
+        SELECT event_type, source_system, SUM(count)::bigint AS count
+        FROM event_counts_1m
+        WHERE bucket > NOW() - make_interval(hours => $1)
         GROUP BY event_type, source_system
         ORDER BY count DESC
         """,
@@ -102,17 +100,12 @@ async def events_by_type(hours: int = 24, ts=Depends(get_ts)):
 async def event_volume(minutes: int = 60, ts=Depends(get_ts)):
     rows = await ts.fetch(
         """
-        SELECT time_bucket('1 minute', time) AS minute,
-               COUNT(*) AS count
-        FROM event_stream
-        WHERE time > NOW() - make_interval(mins => $1)
+        SELECT bucket AS minute, SUM(count)::bigint AS count
+        FROM event_counts_1m
+        WHERE bucket > NOW() - make_interval(mins => $1)
         GROUP BY minute ORDER BY minute
         """,
         minutes,
     )
-    return {
-        "points": [
-            {"minute": r["minute"].isoformat(), "count": r["count"]} for r in rows
-        ],
-        "minutes": minutes,
-    }
+    # ORJSONResponse renders the bucket timestamps itself.
+    return {"points": [dict(r) for r in rows], "minutes": minutes}
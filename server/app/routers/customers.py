@@ -3,17 +3,17 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends
 
-from routers.deps import get_pg
+from routers.deps import get_pg_read
 from services import world
 
 router = APIRouter(tags=["customers"])
 
 
 @router.get("/customers")
-async def list_customers(pg=Depends(get_pg)):
+async def list_customers(pg=Depends(get_pg_read)):
     return {"customers": await world.list_customers(pg)}
 
 
 @router.get("/depots")
-async def list_depots(pg=Depends(get_pg)):
+async def list_depots(pg=Depends(get_pg_read)):
     return {"depots": await world.list_depots(pg)}
@@ -1,19 +1,36 @@
 """FastAPI dependencies shared by all routers."""
 from __future__ import annotations
 
-import asyncpg
 from fastapi import Request
 
-from db.connections import databases
+from core.config import PG_ACQUIRE_TIMEOUT
+from db.connections import BoundedPool, databases
 from eventbus.publisher import EventPublisher, get_publisher
 
 
-async def get_pg() -> asyncpg.Pool:
-    return await databases.connect_postgres()
+# Dependencies resolve on every request. The pools are process-wide singletons
+# created in the lifespan, so take the cached pool directly and only fall
+# through to the connect path before startup. Handlers get it wrapped in a
+# BoundedPool: every query waits at most PG_ACQUIRE_TIMEOUT for a connection,
+# and an exhausted pool answers 503 (PoolTimeout) instead of hanging.
 
 
-async def get_ts() -> asyncpg.Pool:
-    return await databases.connect_timescale()
+async def get_pg() -> BoundedPool:
+    return BoundedPool(databases.pg or await databases.connect_postgres(), PG_ACQUIRE_TIMEOUT)
+
+
+async def get_pg_read() -> BoundedPool:
+    """For handlers that only read the world model; may be a replica.
+
+    Before the replica pool exists (or when none is configured) the primary
+    serves the read: it is always at least as fresh.
+    """
+    pool = databases.pg_read or databases.pg or await databases.connect_postgres_read()
+    return BoundedPool(pool, PG_ACQUIRE_TIMEOUT)
+
+
+async def get_ts() -> BoundedPool:
+    return BoundedPool(databases.ts or await databases.connect_timescale(), PG_ACQUIRE_TIMEOUT)
 
 
 async def get_events(request: Request) -> EventPublisher:
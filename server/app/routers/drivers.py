@@ -4,7 +4,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from routers.deps import get_events, get_pg, get_trace_id
+from routers.deps import get_events, get_pg, get_pg_read, get_trace_id
 from services import world
 from services.world import WorldError
 
@@ -16,7 +16,7 @@ class DriverStatusRequest(BaseModel):
 
 
 @router.get("")
-async def list_drivers(pg=Depends(get_pg)):
+async def list_drivers(pg=Depends(get_pg_read)):
     return {"drivers": await world.list_drivers(pg)}
 
 
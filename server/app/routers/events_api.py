@@ -7,18 +7,24 @@
 """
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
 
 from core import catalog
 from core.envelope import EntityRef, SourceSystem
+from eventbus.publisher import EventValidationError
 from routers.deps import get_events, get_trace_id, get_ts
+from services.eventlog import EVENT_COLUMNS, events_response
 
 router = APIRouter(prefix="/events", tags=["events"])
 
+# Optional equality filters on /recent, in the order their parameters bind.
+# A fixed order keeps the SQL text identical for a given filter combination.
+RECENT_FILTER_COLUMNS = ("event_type", "source_system")
+
 
 @router.get("/recent")
 async def recent_events(
@@ -28,43 +34,24 @@ async def recent_events(
     ts=Depends(get_ts),
 ):
     conditions, params = [], []
-    if event_type:
-        params.append(event_type)
-        conditions.append(f"event_type = ${len(params)}")
-    if source_system:
-        params.append(source_system)
-        conditions.append(f"source_system = ${len(params)}")
+    for column, value in zip(RECENT_FILTER_COLUMNS, (event_type, source_system)):
+        if value:
+            params.append(value)
+            conditions.append(f"{column} = ${len(params)}")
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     params.append(min(limit, 500))
     rows = await ts.fetch(
         f"""
-        SELECT time, event_id, event_type, event_version, source_system, tenant_id,
-               trace_id, entity_refs, occurred_at, payload
+        SELECT {EVENT_COLUMNS}
         FROM event_stream {where}
         ORDER BY time DESC LIMIT ${len(params)}
         """,
         *params,
     )
-    events = [
-        {
-            "eventId": str(r["event_id"]),
-            "eventType": r["event_type"],
-            "eventVersion": r["event_version"],
-            "sourceSystem": r["source_system"],
-            "tenantId": r["tenant_id"],
-            "traceId": str(r["trace_id"]) if r["trace_id"] else None,
-            "entityRefs": json.loads(r["entity_refs"]),
-            "occurredAt": r["occurred_at"].isoformat().replace("+00:00", "Z"),
-            "observedAt": r["time"].isoformat().replace("+00:00", "Z"),
-            "payload": json.loads(r["payload"]),
-        }
-        for r in rows
-    ]
-    return {"events": events, "count": len(events)}
+    return events_response(rows)
 
 
-@router.get("/catalog")
-async def event_catalog():
+def _render_catalog() -> bytes:
     types = []
     for spec in catalog.CATALOG.values():
         types.append(
@@ -75,12 +62,24 @@ async def event_catalog():
                 "payloadSchema": spec.payload_model.model_json_schema(by_alias=True),
             }
         )
-    return {
-        "envelopeVersion": "1.0",
-        "topics": catalog.CANONICAL_TOPICS,
-        "eventTypes": types,
-        "count": len(types),
-    }
+    return orjson.dumps(
+        {
+            "envelopeVersion": "1.0",
+            "topics": catalog.CANONICAL_TOPICS,
+            "eventTypes": types,
+            "count": len(types),
+        }
+    )
+
+
+# The catalog is code, fixed for the life of the process: generate every JSON
+# schema and encode the body once, not per request.
+CATALOG_BODY = _render_catalog()
+
+
+@router.get("/catalog")
+async def event_catalog():
+    return Response(CATALOG_BODY, media_type="application/json")
 
 
 class PublishRequest(BaseModel):
@@ -96,8 +95,6 @@ async def publish_event(
     trace_id=Depends(get_trace_id),
 ):
     """Manually publish a canonical event. Malformed events never reach Kafka."""
-    from eventbus.publisher import EventValidationError
-
     try:
         refs = [EntityRef(**r) for r in body.entityRefs]
     except Exception as e:
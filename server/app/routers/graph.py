@@ -21,15 +21,18 @@ async def driver_impact(driver_id: str):
             """
             MATCH (d:Driver {id: $driver_id})
             OPTIONAL MATCH (r:Route)-[:ASSIGNED_TO]->(d)
-            OPTIONAL MATCH (r)-[:HAS_STOP]->(s:Stop)
-            OPTIONAL MATCH (s)-[:FOR_ORDER]->(o:Order)
-            OPTIONAL MATCH (c:Customer)-[:PLACED]->(o)
-            WITH d, r, s, o, c
+            WITH d, collect(r) AS routes
+            CALL (routes) {
+                UNWIND routes AS r
+                MATCH (r)-[:HAS_STOP]->(s:Stop)
+                OPTIONAL MATCH (s)-[:FOR_ORDER]->(o:Order)
+                RETURN count(DISTINCT s) AS stop_count, collect(DISTINCT o) AS orders
+            }
             RETURN d.name AS driver_name,
-                   collect(DISTINCT {id: r.id, routeNumber: r.routeNumber, status: r.status}) AS routes,
-                   count(DISTINCT s) AS stop_count,
-                   collect(DISTINCT {id: o.id, orderNumber: o.orderNumber, status: o.status,
-                                     customer: c.name}) AS orders
+                   [r IN routes | {id: r.id, routeNumber: r.routeNumber, status: r.status}] AS routes,
+                   stop_count,
+                   [o IN orders | {id: o.id, orderNumber: o.orderNumber, status: o.status,
+                                   customer: head([(c:Customer)-[:PLACED]->(o) | c.name])}] AS orders
             """,
             driver_id=driver_id,
         )
@@ -61,9 +64,10 @@ async def graph_overview():
         result = await session.run(
             "MATCH (n) RETURN labels(n)[0] AS label, count(n) AS c ORDER BY label"
         )
-        nodes = {r["label"]: r["c"] async for r in result}
+        # values() drains each result in one call rather than awaiting per record.
+        nodes = dict(await result.values())
         result = await session.run(
             "MATCH ()-[r]->() RETURN type(r) AS rel, count(r) AS c ORDER BY rel"
         )
-        rels = {r["rel"]: r["c"] async for r in result}
+        rels = dict(await result.values())
     return {"nodes": nodes, "relationships": rels}
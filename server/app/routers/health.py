@@ -6,35 +6,46 @@ import asyncio
 
 from fastapi import APIRouter, Response
 
-from db.connections import databases
+from db.connections import acquire, databases
 from eventbus.publisher import get_publisher
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+CHECK_TIMEOUT_S = 5
+
 
 @router.get("/live")
 async def live():
     return {"status": "ok"}
 
 
+@router.get("/pools")
+async def pools():
+    """asyncpg pool usage (sampled every few seconds in the background)."""
+    return {"pools": databases.pool_stats()}
+
+
 @router.get("")
 async def health(response: Response):
     checks = {}
 
     async def check(name, coro):
         try:
-            await asyncio.wait_for(coro, timeout=5)
+            async with asyncio.timeout(CHECK_TIMEOUT_S):
+                await coro
             checks[name] = "ok"
         except Exception as e:
-            checks[name] = f"error: {e}"
+            checks[name] = f"error: {e!r}"
 
     async def pg_check():
         pool = await databases.connect_postgres()
-        await pool.fetchval("SELECT 1")
+        async with acquire(pool, timeout=CHECK_TIMEOUT_S) as conn:
+            await conn.fetchval("SELECT 1")
 
     async def ts_check():
         pool = await databases.connect_timescale()
-        await pool.fetchval("SELECT 1")
+        async with acquire(pool, timeout=CHECK_TIMEOUT_S) as conn:
+            await conn.fetchval("SELECT 1")
 
     async def neo4j_check():
         driver = await databases.connect_neo4j()
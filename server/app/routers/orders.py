@@ -8,13 +8,15 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
 
 from core.config import TENANT_ID
-from routers.deps import get_events, get_pg, get_trace_id, get_ts
+from routers.deps import get_events, get_pg, get_pg_read, get_trace_id, get_ts
 from services import world
+from services.eventlog import EVENT_COLUMNS, events_response
 from services.world import WorldError
 
 router = APIRouter(prefix="/orders", tags=["orders"])
@@ -69,21 +71,24 @@ async def list_orders(
     unassigned: bool = False,
     limit: int = 100,
     offset: int = 0,
-    pg=Depends(get_pg),
+    after: Optional[str] = None,
+    pg=Depends(get_pg_read),
 ):
     try:
-        return await world.list_orders(pg, status=status, unassigned=unassigned, limit=limit, offset=offset)
+        return await world.list_orders(
+            pg, status=status, unassigned=unassigned, limit=limit, offset=offset, after=after
+        )
     except WorldError as e:
         raise HTTPException(e.status_code, str(e))
 
 
 @router.get("/unassigned")
-async def unassigned_orders(pg=Depends(get_pg)):
+async def unassigned_orders(pg=Depends(get_pg_read)):
     return await world.list_orders(pg, unassigned=True)
 
 
 @router.get("/{order_id}")
-async def get_order(order_id: str, pg=Depends(get_pg)):
+async def get_order(order_id: str, pg=Depends(get_pg_read)):
     try:
         return await world.get_order(pg, order_id)
     except WorldError as e:
@@ -137,36 +142,18 @@ async def assign_order(
 @router.get("/{order_id}/events")
 async def order_events(order_id: str, limit: int = 200, ts=Depends(get_ts)):
     """Every canonical event that references this order — the raw evidence tail."""
-    import json as _json
-
     rows = await ts.fetch(
-        """
-        SELECT time, event_id, event_type, event_version, source_system, tenant_id,
-               trace_id, entity_refs, occurred_at, payload
+        f"""
+        SELECT {EVENT_COLUMNS}
         FROM event_stream
         WHERE entity_refs @> $1::jsonb
         ORDER BY time DESC
         LIMIT $2
         """,
-        _json.dumps([{"type": "order", "id": order_id}]),
+        orjson.dumps([{"type": "order", "id": order_id}]).decode(),
         min(limit, 500),
     )
-    events = [
-        {
-            "eventId": str(r["event_id"]),
-            "eventType": r["event_type"],
-            "eventVersion": r["event_version"],
-            "sourceSystem": r["source_system"],
-            "tenantId": r["tenant_id"],
-            "traceId": str(r["trace_id"]) if r["trace_id"] else None,
-            "entityRefs": _json.loads(r["entity_refs"]),
-            "occurredAt": r["occurred_at"].isoformat().replace("+00:00", "Z"),
-            "observedAt": r["time"].isoformat().replace("+00:00", "Z"),
-            "payload": _json.loads(r["payload"]),
-        }
-        for r in rows
-    ]
-    return {"events": events, "count": len(events)}
+    return events_response(rows)
 
 
 @router.post("/{order_id}/cancel")
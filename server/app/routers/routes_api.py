@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
 from core.config import TENANT_ID
-from routers.deps import get_events, get_pg, get_trace_id
+from routers.deps import get_events, get_pg, get_pg_read, get_trace_id
 from services import world
 from services.world import WorldError
 
@@ -22,7 +22,7 @@ class CreateRouteRequest(BaseModel):
 
 
 @router.get("")
-async def list_routes(status: Optional[str] = None, pg=Depends(get_pg)):
+async def list_routes(status: Optional[str] = None, pg=Depends(get_pg_read)):
     try:
         return {"routes": await world.list_routes(pg, status=status)}
     except WorldError as e:
@@ -30,7 +30,7 @@ async def list_routes(status: Optional[str] = None, pg=Depends(get_pg)):
 
 
 @router.get("/{route_id}")
-async def get_route(route_id: str, pg=Depends(get_pg)):
+async def get_route(route_id: str, pg=Depends(get_pg_read)):
     try:
         return await world.get_route(pg, route_id)
     except WorldError as e:
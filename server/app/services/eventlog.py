@@ -0,0 +1,45 @@
+"""Event log reads — the event_stream projection rendered back as wire envelopes.
+
+Both the Event Console (/api/events/recent) and the order evidence tail
+(/api/orders/{id}/events) read the same table and return the same shape; this
+module is the single definition of that query's columns and row mapping.
+
+entityRefs and payload are jsonb; asyncpg hands them over as JSON text, which
+goes into the response verbatim as orjson Fragments. Neither is parsed into
+Python objects only to be encoded again, so the response is built directly
+rather than through FastAPI's jsonable_encoder, which does not know Fragments.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import asyncpg
+import orjson
+from fastapi.responses import ORJSONResponse
+
+EVENT_COLUMNS = """
+    time, event_id, event_type, event_version, source_system, tenant_id,
+    trace_id, entity_refs, occurred_at, payload
+"""
+
+
+def event_json(r: asyncpg.Record) -> Dict[str, Any]:
+    """One event_stream row as a camelCase envelope (observedAt = ingest time)."""
+    return {
+        "eventId": str(r["event_id"]),
+        "eventType": r["event_type"],
+        "eventVersion": r["event_version"],
+        "sourceSystem": r["source_system"],
+        "tenantId": r["tenant_id"],
+        "traceId": str(r["trace_id"]) if r["trace_id"] else None,
+        "entityRefs": orjson.Fragment(r["entity_refs"]),
+        "occurredAt": r["occurred_at"].isoformat().replace("+00:00", "Z"),
+        "observedAt": r["time"].isoformat().replace("+00:00", "Z"),
+        "payload": orjson.Fragment(r["payload"]),
+    }
+
+
+def events_response(rows: List[asyncpg.Record]) -> ORJSONResponse:
+    """{"events": [...], "count": n} for a list of event_stream rows."""
+    events = [event_json(r) for r in rows]
+    return ORJSONResponse({"events": events, "count": len(events)})
@@ -11,14 +11,19 @@ API JSON is camelCase — the same wire dialect as the event payloads.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import asyncpg
 
+from core.config import DEPOTS_CACHE_SECONDS, PG_ACQUIRE_TIMEOUT
 from core.envelope import EntityRef, EntityType, SourceSystem
-from eventbus.publisher import EventPublisher
+from db.connections import acquire
+from eventbus.publisher import EventPublisher, build_envelope
 
 logger = logging.getLogger(__name__)
 
@@ -79,21 +84,23 @@ async def _compose_orders(pg: asyncpg.Pool, order_rows: List[asyncpg.Record]) ->
     if not order_rows:
         return []
     ids = [r["id"] for r in order_rows]
-    stop_rows = await pg.fetch(
-        f"SELECT {STOP_COLUMNS} FROM stops s WHERE s.order_id = ANY($1)", ids
-    )
-    parcel_rows = await pg.fetch(
-        "SELECT id, order_id, barcode, description, weight_kg, status FROM parcels WHERE order_id = ANY($1) ORDER BY barcode",
-        ids,
-    )
-    route_rows = await pg.fetch(
-        """
-        SELECT r.id AS route_id, r.route_number, r.status AS route_status,
-               d.id AS driver_id, d.first_name || ' ' || d.last_name AS driver_name
-        FROM routes r LEFT JOIN drivers d ON d.id = r.driver_id
-        WHERE r.id IN (SELECT DISTINCT route_id FROM stops WHERE order_id = ANY($1) AND route_id IS NOT NULL)
-        """,
-        ids,
+    # Three independent reads, each on its own pooled connection: the wait is
+    # the slowest query's, not the sum of all three.
+    stop_rows, parcel_rows, route_rows = await asyncio.gather(
+        pg.fetch(f"SELECT {STOP_COLUMNS} FROM stops s WHERE s.order_id = ANY($1)", ids),
+        pg.fetch(
+            "SELECT id, order_id, barcode, description, weight_kg, status FROM parcels WHERE order_id = ANY($1) ORDER BY barcode",
+            ids,
+        ),
+        pg.fetch(
+            """
+            SELECT r.id AS route_id, r.route_number, r.status AS route_status,
+                   d.id AS driver_id, d.first_name || ' ' || d.last_name AS driver_name
+            FROM routes r LEFT JOIN drivers d ON d.id = r.driver_id
+            WHERE r.id IN (SELECT DISTINCT route_id FROM stops WHERE order_id = ANY($1) AND route_id IS NOT NULL)
+            """,
+            ids,
+        ),
     )
     routes_by_id = {str(r["route_id"]): r for r in route_rows}
     stops_by_order: Dict[Any, Dict[str, Dict[str, Any]]] = {}
@@ -149,7 +156,14 @@ async def list_orders(
     unassigned: bool = False,
     limit: int = 100,
     offset: int = 0,
+    after: Optional[str] = None,
 ) -> Dict[str, Any]:
+    """Page through orders by order number.
+
+    Pass the previous page's nextCursor as `after` for keyset paging: the page
+    starts with an index seek on order_number, so deep pages cost the same as
+    the first. `offset` is kept for existing callers and ignored with `after`.
+    """
     conditions, params = [], []
     if status:
         params.append(status.upper())
@@ -160,16 +174,28 @@ async def list_orders(
         )
         conditions.append("o.status NOT IN ('CANCELLED', 'COMPLETED')")
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-    params.extend([limit, offset])
-    rows = await pg.fetch(
-        f"{ORDER_BASE_QUERY} {where} ORDER BY o.order_number LIMIT ${len(params)-1} OFFSET ${len(params)}",
-        *params,
-    )
-    count_params = params[:-2]
-    total = await pg.fetchval(
-        f"SELECT COUNT(*) FROM orders o {where}", *count_params
+    count_params = list(params)
+    if after is not None:
+        params.append(after)
+        conditions.append(f"o.order_number > ${len(params)}")
+        page_where = f"WHERE {' AND '.join(conditions)}"
+        params.append(limit)
+        page = f"LIMIT ${len(params)}"
+    else:
+        page_where = where
+        params.extend([limit, offset])
+        page = f"LIMIT ${len(params)-1} OFFSET ${len(params)}"
+    rows, total = await asyncio.gather(
+        pg.fetch(f"{ORDER_BASE_QUERY} {page_where} ORDER BY o.order_number {page}", *params),
+        pg.fetchval(f"SELECT COUNT(*) FROM orders o {where}", *count_params),
     )
-    return {"orders": await _compose_orders(pg, rows), "total": total, "limit": limit, "offset": offset}
+    return {
+        "orders": await _compose_orders(pg, rows),
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "nextCursor": rows[-1]["order_number"] if rows and len(rows) == limit else None,
+    }
 
 
 async def get_order(pg: asyncpg.Pool, order_id: str) -> Dict[str, Any]:
@@ -180,10 +206,8 @@ async def get_order(pg: asyncpg.Pool, order_id: str) -> Dict[str, Any]:
 
 
 def _uuid(v: str):
-    import uuid as _u
-
     try:
-        return _u.UUID(v)
+        return uuid.UUID(v)
     except ValueError:
         raise WorldError(f"invalid id: {v}", 400)
 
@@ -218,7 +242,7 @@ async def create_order(
     if not customer:
         raise WorldError("customer not found", 404)
 
-    async with pg.acquire() as conn:
+    async with acquire(pg, timeout=PG_ACQUIRE_TIMEOUT) as conn:
         async with conn.transaction():
             order_number = await conn.fetchval(
                 "SELECT 'ORD-' || (1000 + COUNT(*) + 1)::text FROM orders"
@@ -243,32 +267,38 @@ async def create_order(
                 notes,
             )
             order_pk = row["id"]
-            for kind, side in (("PICKUP", pickup), ("DELIVERY", delivery)):
-                await conn.execute(
-                    """
-                    INSERT INTO stops (tenant_id, order_id, kind, status, address, location, window_start, window_end)
-                    VALUES ($1, $2, $3::stop_kind, 'PENDING', $4,
-                            ST_SetSRID(ST_MakePoint($5, $6), 4326)::geography, $7, $8)
-                    """,
-                    tenant_id,
-                    order_pk,
-                    kind,
-                    side["address"],
-                    side["longitude"],
-                    side["latitude"],
-                    side.get("windowStart"),
-                    side.get("windowEnd"),
-                )
-            for k in range(1, parcel_count + 1):
-                await conn.execute(
-                    """
-                    INSERT INTO parcels (tenant_id, order_id, barcode, description, status)
-                    VALUES ($1, $2, $3, 'Parcel', 'PENDING')
-                    """,
-                    tenant_id,
-                    order_pk,
-                    f"PCL-{order_number.removeprefix('ORD-')}-{k}",
-                )
+            # executemany pipelines the rows: one round trip per table.
+            await conn.executemany(
+                """
+                INSERT INTO stops (tenant_id, order_id, kind, status, address, location, window_start, window_end)
+                VALUES ($1, $2, $3::stop_kind, 'PENDING', $4,
+                        ST_SetSRID(ST_MakePoint($5, $6), 4326)::geography, $7, $8)
+                """,
+                [
+                    (
+                        tenant_id,
+                        order_pk,
+                        kind,
+                        side["address"],
+                        side["longitude"],
+                        side["latitude"],
+                        side.get("windowStart"),
+                        side.get("windowEnd"),
+                    )
+                    for kind, side in (("PICKUP", pickup), ("DELIVERY", delivery))
+                ],
+            )
+            barcode_base = order_number.removeprefix("ORD-")
+            await conn.executemany(
+                """
+                INSERT INTO parcels (tenant_id, order_id, barcode, description, status)
+                VALUES ($1, $2, $3, 'Parcel', 'PENDING')
+                """,
+                [
+                    (tenant_id, order_pk, f"PCL-{barcode_base}-{k}")
+                    for k in range(1, parcel_count + 1)
+                ],
+            )
 
     order = await get_order(pg, str(order_pk))
     await publisher.emit(
@@ -331,7 +361,7 @@ async def assign_order_to_route(
     if route["status"] == "COMPLETED":
         raise WorldError(f"route {route['route_number']} is completed")
 
-    async with pg.acquire() as conn:
+    async with acquire(pg, timeout=PG_ACQUIRE_TIMEOUT) as conn:
         async with conn.transaction():
             max_seq = await conn.fetchval(
                 "SELECT COALESCE(MAX(sequence), 0) FROM stops WHERE route_id = $1", route_pk
@@ -446,7 +476,7 @@ async def cancel_order(
     if order["status"] in ("COMPLETED", "CANCELLED"):
         raise WorldError(f"order is already {order['status']}")
 
-    async with pg.acquire() as conn:
+    async with acquire(pg, timeout=PG_ACQUIRE_TIMEOUT) as conn:
         async with conn.transaction():
             await conn.execute("UPDATE orders SET status = 'CANCELLED' WHERE id = $1", order_pk)
             await conn.execute(
@@ -549,7 +579,7 @@ async def create_route(
     vehicle_id: Optional[str] = None,
     trace_id: Optional[str] = None,
 ) -> Dict[str, Any]:
-    async with pg.acquire() as conn:
+    async with acquire(pg, timeout=PG_ACQUIRE_TIMEOUT) as conn:
         async with conn.transaction():
             route_number = await conn.fetchval(
                 "SELECT 'RT-' || (100 + COUNT(*) + 1)::text FROM routes"
@@ -606,7 +636,7 @@ async def start_route(
     if not has_stops:
         raise WorldError(f"route {route['route_number']} has no stops")
 
-    async with pg.acquire() as conn:
+    async with acquire(pg, timeout=PG_ACQUIRE_TIMEOUT) as conn:
         async with conn.transaction():
             await conn.execute(
                 "UPDATE routes SET status = 'ACTIVE', started_at = NOW() WHERE id = $1", route_pk
@@ -679,12 +709,17 @@ async def update_stop_status(
 
     order_completed = False
     route_completed_id = None
-    async with pg.acquire() as conn:
+    async with acquire(pg, timeout=PG_ACQUIRE_TIMEOUT) as conn:
         async with conn.transaction():
-            ts_col = {"ARRIVED": "arrived_at", "COMPLETED": "completed_at"}.get(new_status)
-            set_ts = f", {ts_col} = NOW()" if ts_col else ""
+            # One statement text for every transition (no per-status SQL), so a
+            # single cached plan serves ARRIVED, COMPLETED and FAILED alike.
             await conn.execute(
-                f"UPDATE stops SET status = $1::stop_status{set_ts} WHERE id = $2",
+                """
+                UPDATE stops SET status = $1::stop_status,
+                       arrived_at   = CASE WHEN $1 = 'ARRIVED'   THEN NOW() ELSE arrived_at END,
+                       completed_at = CASE WHEN $1 = 'COMPLETED' THEN NOW() ELSE completed_at END
+                WHERE id = $2
+                """,
                 new_status,
                 stop_pk,
             )
@@ -734,22 +769,26 @@ async def update_stop_status(
     ]
     if stop["route_id"]:
         refs.append(EntityRef(type=EntityType.ROUTE, id=str(stop["route_id"])))
-    await publisher.emit(
-        "stop.status-updated",
-        SourceSystem.API,
-        entity_refs=refs,
-        payload={
-            "stopId": str(stop_pk),
-            "orderId": str(stop["order_id"]),
-            "routeId": str(stop["route_id"]) if stop["route_id"] else None,
-            "kind": stop["kind"],
-            "previousStatus": stop["status"],
-            "status": new_status,
-        },
-        trace_id=trace_id,
-    )
+    # A completing stop can also complete its order and route. Their events go
+    # out together: one wait on the broker instead of one per event.
+    envelopes = [
+        build_envelope(
+            "stop.status-updated",
+            SourceSystem.API,
+            entity_refs=refs,
+            payload={
+                "stopId": str(stop_pk),
+                "orderId": str(stop["order_id"]),
+                "routeId": str(stop["route_id"]) if stop["route_id"] else None,
+                "kind": stop["kind"],
+                "previousStatus": stop["status"],
+                "status": new_status,
+            },
+            trace_id=trace_id,
+        )
+    ]
     if order_completed:
-        await publisher.emit(
+        envelopes.append(build_envelope(
             "order.completed",
             SourceSystem.API,
             entity_refs=[EntityRef(type=EntityType.ORDER, id=str(stop["order_id"]))],
@@ -759,9 +798,9 @@ async def update_stop_status(
                 "routeId": str(stop["route_id"]) if stop["route_id"] else None,
             },
             trace_id=trace_id,
-        )
+        ))
     if route_completed_id:
-        await publisher.emit(
+        envelopes.append(build_envelope(
             "route.completed",
             SourceSystem.API,
             entity_refs=[EntityRef(type=EntityType.ROUTE, id=str(route_completed_id["id"]))],
@@ -770,7 +809,8 @@ async def update_stop_status(
                 "routeNumber": route_completed_id["route_number"],
             },
             trace_id=trace_id,
-        )
+        ))
+    await publisher.publish_many(envelopes)
 
     row = await pg.fetchrow(f"SELECT {STOP_COLUMNS} FROM stops s WHERE s.id = $1", stop_pk)
     return stop_json(row)
@@ -779,37 +819,38 @@ async def update_stop_status(
 # --- Drivers / Vehicles / Customers / Depots --------------------------------
 
 
+DRIVER_BASE_QUERY = """
+    SELECT d.id, d.driver_number, d.first_name, d.last_name, d.phone, d.email, d.status,
+           ST_Y(d.current_location::geometry) AS latitude,
+           ST_X(d.current_location::geometry) AS longitude,
+           d.location_updated_at,
+           r.id AS route_id, r.route_number
+    FROM drivers d
+    LEFT JOIN routes r ON r.driver_id = d.id AND r.status = 'ACTIVE'
+"""
+
+
+def driver_json(r: asyncpg.Record) -> Dict[str, Any]:
+    return {
+        "id": str(r["id"]),
+        "driverNumber": r["driver_number"],
+        "firstName": r["first_name"],
+        "lastName": r["last_name"],
+        "name": f"{r['first_name']} {r['last_name']}",
+        "phone": r["phone"],
+        "email": r["email"],
+        "status": r["status"],
+        "latitude": float(r["latitude"]) if r["latitude"] is not None else None,
+        "longitude": float(r["longitude"]) if r["longitude"] is not None else None,
+        "locationUpdatedAt": _iso(r["location_updated_at"]),
+        "activeRouteId": str(r["route_id"]) if r["route_id"] else None,
+        "activeRouteNumber": r["route_number"],
+    }
+
+
 async def list_drivers(pg: asyncpg.Pool) -> List[Dict[str, Any]]:
-    rows = await pg.fetch(
-        """
-        SELECT d.id, d.driver_number, d.first_name, d.last_name, d.phone, d.email, d.status,
-               ST_Y(d.current_location::geometry) AS latitude,
-               ST_X(d.current_location::geometry) AS longitude,
-               d.location_updated_at,
-               r.id AS route_id, r.route_number, r.status AS route_status
-        FROM drivers d
-        LEFT JOIN routes r ON r.driver_id = d.id AND r.status = 'ACTIVE'
-        ORDER BY d.driver_number
-        """
-    )
-    return [
-        {
-            "id": str(r["id"]),
-            "driverNumber": r["driver_number"],
-            "firstName": r["first_name"],
-            "lastName": r["last_name"],
-            "name": f"{r['first_name']} {r['last_name']}",
-            "phone": r["phone"],
-            "email": r["email"],
-            "status": r["status"],
-            "latitude": float(r["latitude"]) if r["latitude"] is not None else None,
-            "longitude": float(r["longitude"]) if r["longitude"] is not None else None,
-            "locationUpdatedAt": _iso(r["location_updated_at"]),
-            "activeRouteId": str(r["route_id"]) if r["route_id"] else None,
-            "activeRouteNumber": r["route_number"],
-        }
-        for r in rows
-    ]
+    rows = await pg.fetch(f"{DRIVER_BASE_QUERY} ORDER BY d.driver_number")
+    return [driver_json(r) for r in rows]
 
 
 async def update_driver_status(
@@ -842,38 +883,38 @@ async def update_driver_status(
         },
         trace_id=trace_id,
     )
-    drivers = await list_drivers(pg)
-    return next(d for d in drivers if d["id"] == driver_id)
+    return driver_json(await pg.fetchrow(f"{DRIVER_BASE_QUERY} WHERE d.id = $1", row["id"]))
+
+
+VEHICLE_BASE_QUERY = """
+    SELECT v.id, v.vehicle_number, v.kind, v.make, v.model, v.capacity_parcels, v.status,
+           ST_Y(v.current_location::geometry) AS latitude,
+           ST_X(v.current_location::geometry) AS longitude,
+           r.id AS route_id, r.route_number
+    FROM vehicles v
+    LEFT JOIN routes r ON r.vehicle_id = v.id AND r.status = 'ACTIVE'
+"""
+
+
+def vehicle_json(r: asyncpg.Record) -> Dict[str, Any]:
+    return {
+        "id": str(r["id"]),
+        "vehicleNumber": r["vehicle_number"],
+        "kind": r["kind"],
+        "make": r["make"],
+        "model": r["model"],
+        "capacityParcels": r["capacity_parcels"],
+        "status": r["status"],
+        "latitude": float(r["latitude"]) if r["latitude"] is not None else None,
+        "longitude": float(r["longitude"]) if r["longitude"] is not None else None,
+        "activeRouteId": str(r["route_id"]) if r["route_id"] else None,
+        "activeRouteNumber": r["route_number"],
+    }
 
 
 async def list_vehicles(pg: asyncpg.Pool) -> List[Dict[str, Any]]:
-    rows = await pg.fetch(
-        """
-        SELECT v.id, v.vehicle_number, v.kind, v.make, v.model, v.capacity_parcels, v.status,
-               ST_Y(v.current_location::geometry) AS latitude,
-               ST_X(v.current_location::geometry) AS longitude,
-               r.id AS route_id, r.route_number
-        FROM vehicles v
-        LEFT JOIN routes r ON r.vehicle_id = v.id AND r.status = 'ACTIVE'
-        ORDER BY v.vehicle_number
-        """
-    )
-    return [
-        {
-            "id": str(r["id"]),
-            "vehicleNumber": r["vehicle_number"],
-            "kind": r["kind"],
-            "make": r["make"],
-            "model": r["model"],
-            "capacityParcels": r["capacity_parcels"],
-            "status": r["status"],
-            "latitude": float(r["latitude"]) if r["latitude"] is not None else None,
-            "longitude": float(r["longitude"]) if r["longitude"] is not None else None,
-            "activeRouteId": str(r["route_id"]) if r["route_id"] else None,
-            "activeRouteNumber": r["route_number"],
-        }
-        for r in rows
-    ]
+    rows = await pg.fetch(f"{VEHICLE_BASE_QUERY} ORDER BY v.vehicle_number")
+    return [vehicle_json(r) for r in rows]
 
 
 async def update_vehicle_status(
@@ -906,8 +947,7 @@ async def update_vehicle_status(
         },
         trace_id=trace_id,
     )
-    vehicles = await list_vehicles(pg)
-    return next(v for v in vehicles if v["id"] == vehicle_id)
+    return vehicle_json(await pg.fetchrow(f"{VEHICLE_BASE_QUERY} WHERE v.id = $1", row["id"]))
 
 
 async def list_customers(pg: asyncpg.Pool) -> List[Dict[str, Any]]:
@@ -937,7 +977,23 @@ async def list_customers(pg: asyncpg.Pool) -> List[Dict[str, Any]]:
     ]
 
 
+# (expires_at, depots). Only the seed writes depots, so within one process every
+# UI bootstrap can share a single read until it expires.
+_depots_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+
 async def list_depots(pg: asyncpg.Pool) -> List[Dict[str, Any]]:
+    global _depots_cache
+    now = time.monotonic()
+    if _depots_cache is not None and _depots_cache[0] > now:
+        return _depots_cache[1]
+    depots = await _fetch_depots(pg)
+    if DEPOTS_CACHE_SECONDS > 0:
+        _depots_cache = (now + DEPOTS_CACHE_SECONDS, depots)
+    return depots
+
+
+async def _fetch_depots(pg: asyncpg.Pool) -> List[Dict[str, Any]]:
     rows = await pg.fetch(
         """
         SELECT id, name, address,
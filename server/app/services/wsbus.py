@@ -2,20 +2,24 @@
 
 The API process runs a single background task that consumes every canonical
 topic and fans each envelope out to all connected UI clients verbatim (camelCase
-wire form). The UI therefore sees exactly what is on the backbone — the Event
-Console renders raw envelopes, the dispatch map picks out driver.location-updated.
+wire form), as binary frames of UTF-8 JSON. JSON messages are forwarded as the
+bytes on the topic: the publisher already validated them, and parsing only to
+re-serialize would be pure cost. MessagePack topics (EVENTBUS_MSGPACK_TOPICS)
+are transcoded to the same JSON. The UI therefore sees exactly what is on the
+backbone — the Event Console renders raw envelopes, the dispatch map picks out
+driver.location-updated.
 """
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import Set
 
 from fastapi import WebSocket
 
 from core.catalog import CANONICAL_TOPICS
-from eventbus.consumer import build_consumer, envelopes
+from eventbus import codec
+from eventbus.consumer import build_consumer
 
 logger = logging.getLogger(__name__)
 
@@ -36,18 +40,22 @@ class ConnectionManager:
     def count(self) -> int:
         return len(self._connections)
 
-    async def broadcast_json(self, data: dict) -> None:
+    async def broadcast_bytes(self, payload: bytes) -> None:
+        """Send to every client concurrently; one slow socket no longer holds up the rest.
+
+        Binary frames hand the same buffer to every socket; a text frame would
+        be UTF-8 encoded again for each client.
+        """
         if not self._connections:
             return
-        text = json.dumps(data)
-        dead = []
-        for ws in self._connections:
-            try:
-                await ws.send_text(text)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(ws)
+        # Snapshot: clients may connect or drop while the sends are in flight.
+        clients = list(self._connections)
+        results = await asyncio.gather(
+            *(ws.send_bytes(payload) for ws in clients), return_exceptions=True
+        )
+        for ws, result in zip(clients, results):
+            if isinstance(result, Exception):
+                self.disconnect(ws)
 
 
 manager = ConnectionManager()
@@ -56,12 +64,27 @@ manager = ConnectionManager()
 async def pump_events_to_websockets() -> None:
     """Consume lip.* and broadcast every envelope to connected clients. Runs forever."""
     while True:
-        consumer = build_consumer(CANONICAL_TOPICS, group_id="lip-ws-bridge")
+        # Groupless: every API worker process reads every partition, so each
+        # one's websocket clients see the whole backbone. Live tail only.
+        consumer = build_consumer(CANONICAL_TOPICS, group_id=None)
         try:
             await consumer.start()
             logger.info("ws bridge consuming %s", CANONICAL_TOPICS)
-            async for _topic, envelope in envelopes(consumer):
-                await manager.broadcast_json(envelope.to_wire())
+            while True:
+                polled = await consumer.getmany(timeout_ms=200)
+                for tp, messages in polled.items():
+                    for message in messages:
+                        if message.value is None:
+                            continue
+                        try:
+                            payload = codec.to_json_bytes(message.value, message.headers)
+                        # ValueError: undecodable MessagePack; TypeError: a value
+                        # orjson cannot render. Skip the message, not the consumer:
+                        # a reconnect would start at latest and drop the gap.
+                        except (TypeError, ValueError) as e:
+                            logger.warning("skipping undecodable message on %s: %s", tp.topic, e)
+                            continue
+                        await manager.broadcast_bytes(payload)
         except asyncio.CancelledError:
             raise
         except Exception as e:
@@ -0,0 +1,59 @@
+"""acquire() tests — no databases needed; the pool hands out a connection on cue."""
+import asyncio
+
+import pytest
+
+from db import connections
+
+
+class GatedPool:
+    """Stands in for asyncpg.Pool: acquire() blocks until the test opens the gate."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.released = []
+
+    async def acquire(self):
+        await self.gate.wait()
+        return "conn"
+
+    async def release(self, conn):
+        self.released.append(conn)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_cancelled_acquire_returns_late_connection_to_pool():
+    async def scenario():
+        pool = GatedPool()
+
+        async def request():
+            async with connections.acquire(pool):
+                pass
+
+        task = asyncio.create_task(request())
+        await settle()  # the request is now waiting on the pool
+        task.cancel()  # e.g. the client disconnected
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        pool.gate.set()  # the pool hands out a connection after the caller left
+        await settle()
+        return pool.released
+
+    assert asyncio.run(scenario()) == ["conn"]
+
+
+def test_acquire_timeout_raises_pool_timeout_and_releases_late_connection():
+    async def scenario():
+        pool = GatedPool()
+        with pytest.raises(connections.PoolTimeout):
+            async with connections.acquire(pool, timeout=0.01):
+                pass
+        pool.gate.set()
+        await settle()
+        return pool.released
+
+    assert asyncio.run(scenario()) == ["conn"]
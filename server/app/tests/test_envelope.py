@@ -3,6 +3,7 @@
 Run locally (no services needed):  cd server && pip install -r requirements.txt
                                    cd app && python -m pytest tests -q
 """
+import json
 from datetime import datetime, timezone
 
 import pytest
@@ -10,6 +11,8 @@ from pydantic import ValidationError
 
 from core import catalog
 from core.envelope import EntityRef, EntityType, EventEnvelope, SourceSystem
+from eventbus import codec
+from eventbus.consumer import parse_envelope
 from eventbus.publisher import EventValidationError, build_envelope
 
 NOW = datetime(2026, 7, 9, 14, 0, 0, tzinfo=timezone.utc)
@@ -130,6 +133,46 @@ def test_wire_roundtrip():
     assert parsed.occurred_at == env.occurred_at
 
 
+def test_wire_bytes_match_wire_dict():
+    env = build_envelope(
+        "driver.location-updated",
+        SourceSystem.SIMULATOR,
+        [EntityRef(type=EntityType.DRIVER, id="d1")],
+        valid_location_payload(),
+        occurred_at=NOW,
+    )
+    assert json.loads(env.to_wire_bytes()) == env.to_wire()
+
+
+def test_trusted_wire_matches_validated():
+    env = build_envelope(
+        "driver.location-updated",
+        SourceSystem.SIMULATOR,
+        [EntityRef(type=EntityType.DRIVER, id="d1")],
+        valid_location_payload(),
+        occurred_at=NOW,
+    )
+    wire = env.to_wire()
+    assert EventEnvelope.from_trusted_wire(wire) == EventEnvelope.model_validate(wire)
+
+
+def test_msgpack_topic_roundtrip(monkeypatch):
+    topic = catalog.TOPIC_DRIVER_LOCATIONS
+    monkeypatch.setattr(codec, "EVENTBUS_MSGPACK_TOPICS", frozenset({topic}))
+    env = build_envelope(
+        "driver.location-updated",
+        SourceSystem.SIMULATOR,
+        [EntityRef(type=EntityType.DRIVER, id="d1")],
+        valid_location_payload(),
+        occurred_at=NOW,
+    )
+    raw, header = codec.encode(env, topic)
+    assert header == codec.MSGPACK_HEADER
+    assert parse_envelope(raw, [header]) == env
+    assert json.loads(codec.to_json_bytes(raw, [header])) == env.to_wire()
+    assert codec.encode(env, "lip.orders") == (env.to_wire_bytes(), None)
+
+
 def test_every_catalog_topic_is_canonical():
     for spec in catalog.CATALOG.values():
         assert spec.topic in catalog.CANONICAL_TOPICS, spec.name
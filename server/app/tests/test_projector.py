@@ -0,0 +1,67 @@
+"""Graph batching tests — _graph_runs is pure, so no Neo4j is needed."""
+from datetime import datetime, timezone
+
+from core.envelope import EntityRef, EntityType, SourceSystem
+from eventbus.publisher import build_envelope
+from workers.projector import _graph_runs
+
+NOW = datetime(2026, 7, 9, 14, 0, 0, tzinfo=timezone.utc)
+
+ENTITIES = {"stops": EntityType.STOP, "routes": EntityType.ROUTE}
+
+
+def change(table, op, row):
+    entity = ENTITIES[table]
+    return build_envelope(
+        f"{entity.value}.record-{op}",
+        SourceSystem.CDC_NORMALIZER,
+        [EntityRef(type=entity, id=row["id"])],
+        {
+            "table": table,
+            "op": op,
+            "before": row if op == "deleted" else None,
+            "after": None if op == "deleted" else row,
+            "sourceTsMs": 1234567890,
+        },
+        occurred_at=NOW,
+    )
+
+
+def shape(runs):
+    return [(table, deleted, list(rows)) for table, deleted, rows in runs]
+
+
+def test_runs_split_on_table_or_op_change_in_stream_order():
+    runs = _graph_runs([
+        change("stops", "created", {"id": "s1"}),
+        change("stops", "updated", {"id": "s2"}),
+        change("routes", "updated", {"id": "r1"}),
+        change("stops", "updated", {"id": "s3"}),
+        change("stops", "deleted", {"id": "s1"}),
+    ])
+    assert shape(runs) == [
+        ("stops", False, ["s1", "s2"]),
+        ("routes", False, ["r1"]),
+        ("stops", False, ["s3"]),
+        ("stops", True, ["s1"]),
+    ]
+
+
+def test_last_image_per_id_wins_within_a_run():
+    runs = _graph_runs([
+        change("stops", "updated", {"id": "s1", "status": "PENDING"}),
+        change("stops", "updated", {"id": "s2", "status": "PENDING"}),
+        change("stops", "updated", {"id": "s1", "status": "ARRIVED"}),
+    ])
+    assert shape(runs) == [("stops", False, ["s1", "s2"])]
+    assert runs[0][2]["s1"]["status"] == "ARRIVED"
+
+
+def test_later_table_delete_stays_after_earlier_upsert():
+    # The stop upsert MERGEs route r1 as a placeholder; deleting r1 first
+    # would let that placeholder survive the batch.
+    runs = _graph_runs([
+        change("stops", "updated", {"id": "s1", "route_id": "r1"}),
+        change("routes", "deleted", {"id": "r1"}),
+    ])
+    assert shape(runs) == [("stops", False, ["s1"]), ("routes", True, ["r1"])]
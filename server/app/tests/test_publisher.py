@@ -0,0 +1,66 @@
+"""Publisher delivery tests — no broker needed; the producer's acks are settled by hand."""
+import asyncio
+
+import pytest
+from aiokafka.errors import KafkaTimeoutError
+
+from core.envelope import EntityRef, EntityType, SourceSystem
+from eventbus.publisher import EventPublisher, build_envelope
+
+
+class HandAckedProducer:
+    """Stands in for AIOKafkaProducer: send() returns a delivery future the test settles."""
+
+    def __init__(self):
+        self.deliveries = []
+
+    async def send(self, topic, value=None, key=None, headers=None):
+        delivery = asyncio.get_running_loop().create_future()
+        self.deliveries.append(delivery)
+        return delivery
+
+
+def location_event():
+    return build_envelope(
+        "driver.location-updated",
+        SourceSystem.SIMULATOR,
+        [EntityRef(type=EntityType.DRIVER, id="d1")],
+        {
+            "driverId": "d2000000-0000-4000-8000-000000000001",
+            "location": {"latitude": 30.26, "longitude": -97.74},
+        },
+    )
+
+
+def started_publisher():
+    pub = EventPublisher()
+    pub._producer = HandAckedProducer()
+    return pub
+
+
+def test_flush_raises_background_delivery_error_once():
+    async def scenario():
+        pub = started_publisher()
+        await pub.publish(location_event(), wait=False)
+        await pub.publish(location_event(), wait=False)
+        failed, acked = pub._producer.deliveries
+        failed.set_exception(KafkaTimeoutError())
+        acked.set_result(None)
+        with pytest.raises(KafkaTimeoutError):
+            await pub.flush()
+        await pub.flush()  # reported once; the next flush starts clean
+
+    asyncio.run(scenario())
+
+
+def test_flush_waits_for_outstanding_acks():
+    async def scenario():
+        pub = started_publisher()
+        await pub.publish(location_event(), wait=False)
+        flushing = asyncio.create_task(pub.flush())
+        await asyncio.sleep(0)
+        assert not flushing.done()
+        pub._producer.deliveries[0].set_result(None)
+        await flushing
+
+    asyncio.run(scenario())
@@ -0,0 +1,64 @@
+"""Order paging tests — no database needed; the pool returns canned order rows."""
+import asyncio
+from datetime import datetime, timezone
+
+from services import world
+
+NOW = datetime(2026, 7, 9, 14, 0, 0, tzinfo=timezone.utc)
+
+
+def order_row(number):
+    return {
+        "id": f"o-{number}",
+        "order_number": number,
+        "status": "CREATED",
+        "service_level": "ROUTINE",
+        "notes": None,
+        "customer_id": "c1",
+        "customer_code": "C1",
+        "customer_name": "Customer One",
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+class OrdersPool:
+    """Answers the order page query with `rows`; stops, parcels and routes are empty."""
+
+    def __init__(self, rows, total):
+        self.rows = rows
+        self.total = total
+        self.page_query = None
+
+    async def fetch(self, query, *args):
+        if query.lstrip().startswith(world.ORDER_BASE_QUERY.strip()):
+            self.page_query = (query, args)
+            return self.rows
+        return []
+
+    async def fetchval(self, query, *args):
+        return self.total
+
+
+def test_keyset_page_after_cursor():
+    pool = OrdersPool([order_row("ORD-1002"), order_row("ORD-1003")], total=3)
+    page = asyncio.run(world.list_orders(pool, limit=2, after="ORD-1001"))
+    assert [o["orderNumber"] for o in page["orders"]] == ["ORD-1002", "ORD-1003"]
+    assert page["nextCursor"] == "ORD-1003"
+    query, args = pool.page_query
+    assert "o.order_number > $1" in query
+    assert args == ("ORD-1001", 2)
+
+
+def test_last_page_after_cursor_has_no_cursor():
+    pool = OrdersPool([order_row("ORD-1003")], total=3)
+    page = asyncio.run(world.list_orders(pool, limit=2, after="ORD-1002"))
+    assert page["nextCursor"] is None
+
+
+def test_empty_page_has_no_cursor():
+    for limit, after in ((0, None), (0, "ORD-1001"), (2, "ORD-1003")):
+        pool = OrdersPool([], total=3)
+        page = asyncio.run(world.list_orders(pool, limit=limit, after=after))
+        assert page["orders"] == []
+        assert page["nextCursor"] is None
@@ -29,7 +29,7 @@ from core.config import TENANT_ID
 from core.envelope import EntityRef, EntityType, SourceSystem
 from db.connections import databases
 from eventbus.admin import reset_canonical_topics
-from eventbus.publisher import EventPublisher
+from eventbus.publisher import EventPublisher, build_envelope
 
 logger = logging.getLogger("demo_reset")
 
@@ -48,6 +48,8 @@ async def reseed_postgres() -> None:
 async def truncate_timescale() -> None:
     ts = await databases.connect_timescale()
     await ts.execute("TRUNCATE event_stream, driver_locations")
+    # Empty the aggregate now rather than waiting for its next policy run.
+    await ts.execute("CALL refresh_continuous_aggregate('event_counts_1m', NULL, NULL)")
     logger.info("timescale projections truncated")
 
 
@@ -70,8 +72,10 @@ async def emit_genesis_events(publisher: EventPublisher) -> dict:
         FROM routes r ORDER BY r.route_number
         """
     )
+    # Genesis events are built up front and published in one pipelined burst.
+    genesis = []
     for r in routes:
-        await publisher.emit(
+        genesis.append(build_envelope(
             "route.planned",
             SourceSystem.SEEDER,
             entity_refs=[
@@ -87,7 +91,7 @@ async def emit_genesis_events(publisher: EventPublisher) -> dict:
                 "vehicleId": str(r["vehicle_id"]) if r["vehicle_id"] else None,
                 "stopCount": r["stop_count"],
             },
-        )
+        ))
 
     orders = await pg.fetch(
         """
@@ -123,7 +127,7 @@ async def emit_genesis_events(publisher: EventPublisher) -> dict:
         pair = stops_by_order.get(o["id"], {})
         if "PICKUP" not in pair or "DELIVERY" not in pair:
             continue
-        await publisher.emit(
+        genesis.append(build_envelope(
             "order.created",
             SourceSystem.SEEDER,
             entity_refs=[
@@ -141,7 +145,8 @@ async def emit_genesis_events(publisher: EventPublisher) -> dict:
                 "delivery": snapshot(pair["DELIVERY"]),
                 "notes": o["notes"],
             },
-        )
+        ))
+    await publisher.publish_many(genesis)
 
     counts = {
         "routes": len(routes),
@@ -9,14 +9,13 @@ What it does:
        infra       __consumer_offsets, debezium bookkeeping, connect internals
        UNEXPECTED  anything else         -> audit FAILS (a producer is off-contract)
   2. Reads every canonical topic from the beginning and validates every single
-     message: JSON -> EventEnvelope -> eventType registered in the catalog ->
-     payload matches that type's schema.
+     message: JSON (or MessagePack, per its contentType header) -> EventEnvelope
+     -> eventType registered in the catalog -> payload matches that type's schema.
   3. Prints a per-topic report and exits non-zero on any violation.
 """
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 import sys
@@ -29,6 +28,7 @@ from pydantic import ValidationError
 from core import catalog
 from core.config import KAFKA_BOOTSTRAP_SERVERS
 from core.envelope import EventEnvelope
+from eventbus import codec
 
 logger = logging.getLogger("topic_audit")
 
@@ -64,7 +64,7 @@ def classify(topic: str) -> str:
     return "unexpected"
 
 
-def validate_message(raw: bytes, report: TopicReport) -> None:
+def validate_message(raw: bytes, headers: codec.Headers, report: TopicReport) -> None:
     report.messages += 1
 
     def fail(msg: str) -> None:
@@ -72,9 +72,9 @@ def validate_message(raw: bytes, report: TopicReport) -> None:
             report.errors.append(msg)
 
     try:
-        data = json.loads(raw)
-    except (json.JSONDecodeError, UnicodeDecodeError) as e:
-        fail(f"not JSON: {e}")
+        data = codec.decode(raw, headers)
+    except ValueError as e:
+        fail(f"undecodable ({'msgpack' if codec.is_msgpack(headers) else 'JSON'}): {e}")
         return
     try:
         envelope = EventEnvelope.model_validate(data)
@@ -138,7 +138,7 @@ async def audit() -> int:
                 idle_rounds = 0
                 for tp, messages in batches.items():
                     for m in messages:
-                        validate_message(m.value, reports_by_topic[tp.topic])
+                        validate_message(m.value, m.headers, reports_by_topic[tp.topic])
                         if m.offset + 1 >= remaining.get(tp, 0):
                             remaining.pop(tp, None)
         reports: List[TopicReport] = [reports_by_topic[t] for t in buckets["canonical"]]
@@ -11,18 +11,20 @@ surfaces on the backbone seconds later as a well-formed event.
 """
 from __future__ import annotations
 
-import asyncio
 import base64
-import json
 import logging
+import time
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
+import simdjson
+import uvloop
 from aiokafka import AIOKafkaConsumer
 from shapely import wkb as shapely_wkb
 
 from core.config import KAFKA_BOOTSTRAP_SERVERS, TENANT_ID
 from core.envelope import EntityRef, EntityType, SourceSystem
+from eventbus.consumer import FETCH_TUNING
 from eventbus.publisher import EventPublisher, EventValidationError
 
 logger = logging.getLogger(__name__)
@@ -42,9 +44,18 @@ TABLE_TO_ENTITY = {
 
 OP_TO_ACTION = {"c": "created", "r": "created", "u": "updated", "d": "deleted"}
 
+# (table, action) -> canonical event type, built once rather than formatted per row.
+RECORD_EVENT_TYPES = {
+    (table, action): f"{entity.value}.record-{action}"
+    for table, entity in TABLE_TO_ENTITY.items()
+    for action in set(OP_TO_ACTION.values())
+}
+
 GEOGRAPHY_COLUMNS = {"location", "current_location"}
 EPOCH_DATE_COLUMNS = {"service_date"}  # Debezium encodes DATE as days since epoch
 
+_PARSER = simdjson.Parser()  # reused so its buffers are sized once, not per message
+
 
 def _decode_geography(value: Any) -> Optional[Dict[str, float]]:
     """Debezium serializes PostGIS geography as {'wkb': base64, 'srid': n}."""
@@ -74,26 +85,39 @@ def _clean_row(row: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     return out
 
 
-def _unwrap(value: Dict[str, Any]) -> Dict[str, Any]:
-    """Support both converter configs: schemas enabled ({schema, payload}) or plain."""
-    if set(value.keys()) == {"schema", "payload"}:
-        return value["payload"]
-    return value
+def parse_change(raw: bytes) -> Optional[Dict[str, Any]]:
+    """Parse a raw CDC record, materializing only changes we will publish.
 
+    Supports both converter configs: schemas enabled ({schema, payload}) or
+    plain. simdjson indexes the document without building Python objects, so
+    the `schema` half of a schemas-enabled record (most of its bytes),
+    heartbeats, truncates, transaction markers and changes to unmapped tables
+    are inspected in place and dropped. Raises ValueError on malformed JSON.
+    """
+    doc = _PARSER.parse(raw)
+    if not isinstance(doc, simdjson.Object):
+        return None
+    if len(doc) == 2 and "schema" in doc and "payload" in doc:
+        doc = doc["payload"]
+        if not isinstance(doc, simdjson.Object):
+            return None
+    if doc.get("op") not in OP_TO_ACTION:
+        return None
+    source = doc.get("source")
+    table = source.get("table") if isinstance(source, simdjson.Object) else None
+    if table not in TABLE_TO_ENTITY:
+        logger.debug("ignoring CDC for unmapped table %r", table)
+        return None
+    # The parser reuses its buffers on the next parse; copy out what we keep.
+    return doc.as_dict()
 
-async def handle_record(publisher: EventPublisher, value: Dict[str, Any]) -> bool:
-    change = _unwrap(value)
-    op = change.get("op")
-    action = OP_TO_ACTION.get(op)
-    if action is None:  # heartbeats, truncates, transaction markers
-        return False
 
-    source = change.get("source") or {}
-    table = source.get("table")
-    entity = TABLE_TO_ENTITY.get(table)
-    if entity is None:
-        logger.debug("ignoring CDC for unmapped table %r", table)
-        return False
+async def handle_record(publisher: EventPublisher, change: Dict[str, Any]) -> bool:
+    """Republish one change that parse_change kept (a mapped table, a real op)."""
+    action = OP_TO_ACTION[change["op"]]
+    source = change["source"]
+    table = source["table"]
+    entity = TABLE_TO_ENTITY[table]
 
     before = _clean_row(change.get("before"))
     after = _clean_row(change.get("after"))
@@ -111,7 +135,7 @@ async def handle_record(publisher: EventPublisher, value: Dict[str, Any]) -> boo
 
     try:
         await publisher.emit(
-            f"{entity.value}.record-{action}",
+            RECORD_EVENT_TYPES[table, action],
             SourceSystem.CDC_NORMALIZER,
             entity_refs=[EntityRef(type=entity, id=str(row["id"]))],
             payload={
@@ -122,6 +146,7 @@ async def handle_record(publisher: EventPublisher, value: Dict[str, Any]) -> boo
                 "sourceTsMs": ts_ms,
             },
             occurred_at=occurred_at,
+            wait=False,  # acked in bulk by publisher.flush() before the commit
         )
         return True
     except EventValidationError as e:
@@ -129,6 +154,19 @@ async def handle_record(publisher: EventPublisher, value: Dict[str, Any]) -> boo
         return False
 
 
+async def normalize_message(publisher: EventPublisher, raw: Optional[bytes], topic: str) -> bool:
+    if raw is None:  # tombstone after a delete
+        return False
+    try:
+        change = parse_change(raw)
+    except ValueError:
+        logger.warning("skipping undecodable CDC message on %s", topic)
+        return False
+    if change is None:
+        return False
+    return await handle_record(publisher, change)
+
+
 async def run() -> None:
     publisher = EventPublisher()
     await publisher.start()
@@ -138,8 +176,9 @@ async def run() -> None:
         group_id="lip-cdc-normalizer",
         value_deserializer=lambda m: m,
         auto_offset_reset="earliest",
-        enable_auto_commit=True,
+        enable_auto_commit=False,  # committed after each batch is republished
         metadata_max_age_ms=5000,
+        **FETCH_TUNING,
     )
     await consumer.start()
     consumer.subscribe(pattern=CDC_TOPIC_PATTERN)
@@ -147,20 +186,20 @@ async def run() -> None:
 
     emitted = 0
     try:
-        async for message in consumer:
-            if message.value is None:
-                continue
-            try:
-                value = json.loads(message.value)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                logger.warning("skipping undecodable CDC message on %s", message.topic)
+        while True:
+            polled = await consumer.getmany(timeout_ms=500, max_records=500)
+            if not polled:
                 continue
-            if not isinstance(value, dict):
-                continue
-            if await handle_record(publisher, value):
-                emitted += 1
-                if emitted % 100 == 0:
-                    logger.info("normalized %d change records", emitted)
+            before = emitted
+            for tp, messages in polled.items():
+                for message in messages:
+                    if await normalize_message(publisher, message.value, tp.topic):
+                        emitted += 1
+            # At-least-once: offsets only advance once the whole batch is on lip.cdc.
+            await publisher.flush()
+            await consumer.commit()
+            if emitted // 100 > before // 100:
+                logger.info("normalized %d change records", emitted)
     finally:
         await consumer.stop()
         await publisher.stop()
@@ -170,13 +209,11 @@ def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
     while True:
         try:
-            asyncio.run(run())
+            uvloop.run(run())
         except KeyboardInterrupt:
             break
         except Exception as e:
             logger.error("normalizer crashed (%s); restarting in 5s", e)
-            import time
-
             time.sleep(5)
 
 
@@ -15,15 +15,25 @@ rebuild from replay. That property is what demo reset leans on.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from core.catalog import CANONICAL_TOPICS
+import asyncpg
+import orjson
+import uvloop
+from neo4j import AsyncDriver
+from neo4j.exceptions import ServiceUnavailable, SessionExpired
+
+from core.catalog import CANONICAL_TOPICS, RECORD_CHANGE_TYPES
+from core.config import EVENTBUS_PARSE_WORKERS
 from core.envelope import EventEnvelope
 from db.connections import databases
-from eventbus.consumer import build_consumer, envelopes
+from eventbus.consumer import build_consumer, envelope_batches
 
 logger = logging.getLogger(__name__)
 
@@ -40,16 +50,28 @@ CONSTRAINTS = [
 ]
 
 
-async def write_event_stream(envelope: EventEnvelope) -> None:
-    ts = await databases.connect_timescale()
-    await ts.execute(
-        """
-        INSERT INTO event_stream
-            (time, event_id, event_type, event_version, source_system, tenant_id,
-             trace_id, entity_refs, occurred_at, payload)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-        ON CONFLICT DO NOTHING
-        """,
+# Executed once per consumer batch (executemany pipelines the rows), so there
+# is no per-event round-trip. asyncpg's statement cache keeps it prepared on
+# each pooled connection; under PG_USE_PGBOUNCER that cache is off and it is
+# parsed per batch instead.
+EVENT_STREAM_INSERT = """
+    INSERT INTO event_stream
+        (time, event_id, event_type, event_version, source_system, tenant_id,
+         trace_id, entity_refs, occurred_at, payload)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    ON CONFLICT DO NOTHING
+"""
+
+# Failures of the connection itself rather than of the rows sent over it.
+# These are never swallowed: they end run(), and main() restarts it with fresh
+# connections, so a dead connection cannot silently drop every later batch.
+CONNECTION_ERRORS = (asyncpg.ConnectionDoesNotExistError, asyncpg.PostgresConnectionError, OSError)
+# The same for Neo4j, once the driver's own transaction retries give up.
+GRAPH_CONNECTION_ERRORS = (ServiceUnavailable, SessionExpired)
+
+
+def event_stream_row(envelope: EventEnvelope) -> Tuple:
+    return (
         envelope.observed_at,
         envelope.event_id,
         envelope.event_type,
@@ -57,70 +79,170 @@ async def write_event_stream(envelope: EventEnvelope) -> None:
         envelope.source_system.value,
         envelope.tenant_id,
         envelope.trace_id,
-        json.dumps([r.model_dump() for r in envelope.entity_refs]),
+        orjson.dumps([{"type": r.type.value, "id": r.id} for r in envelope.entity_refs]).decode(),
         envelope.occurred_at,
-        json.dumps(envelope.payload),
+        orjson.dumps(envelope.payload).decode(),
     )
 
 
+async def write_event_stream(conn: asyncpg.Connection, envelopes: List[EventEnvelope]) -> None:
+    """Append a batch of envelopes to event_stream.
+
+    executemany is all-or-nothing, so if the batch fails it is retried row by
+    row: one bad event is logged and skipped instead of dropping its batch.
+    A lost connection is not a bad row and is raised as is.
+    """
+    rows = [event_stream_row(e) for e in envelopes]
+    try:
+        await conn.executemany(EVENT_STREAM_INSERT, rows)
+    except CONNECTION_ERRORS:
+        raise
+    except Exception:
+        if len(rows) == 1:
+            raise
+        for envelope, row in zip(envelopes, rows):
+            try:
+                await conn.executemany(EVENT_STREAM_INSERT, [row])
+            except CONNECTION_ERRORS:
+                raise
+            except Exception as e:
+                logger.error("event_stream insert failed for %s: %s", envelope.event_type, e)
+
+
 # --- driver telemetry -------------------------------------------------------
 
+# Telemetry is written in bulk: rows from one consumer batch are COPYed into a
+# session temp table, then moved into the hypertable in one statement. COPY
+# itself cannot skip conflicts, and replay re-delivers rows already stored.
+# The temp table is ensured inside each batch's transaction: a no-op once the
+# pooled connection has it, and still correct when the batch gets a fresh
+# connection or a pooler hands it another backend.
+DRIVER_LOCATION_STAGING = """
+    CREATE TEMP TABLE IF NOT EXISTS driver_locations_in (
+        time        TIMESTAMPTZ,
+        tenant_id   TEXT,
+        driver_id   UUID,
+        vehicle_id  UUID,
+        route_id    UUID,
+        longitude   DOUBLE PRECISION,
+        latitude    DOUBLE PRECISION,
+        speed_mph   DOUBLE PRECISION,
+        heading_deg DOUBLE PRECISION
+    ) ON COMMIT DELETE ROWS
+"""
+
+DRIVER_LOCATION_STAGING_COLUMNS = [
+    "time", "tenant_id", "driver_id", "vehicle_id", "route_id",
+    "longitude", "latitude", "speed_mph", "heading_deg",
+]
+
+DRIVER_LOCATION_MOVE = """
+    INSERT INTO driver_locations (time, tenant_id, driver_id, vehicle_id, route_id, location, speed_mph, heading_deg)
+    SELECT time, tenant_id, driver_id, vehicle_id, route_id,
+           ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography, speed_mph, heading_deg
+    FROM driver_locations_in
+    ON CONFLICT DO NOTHING
+"""
+
+
+async def insert_driver_locations_bulk(conn: asyncpg.Connection, rows: List[Tuple]) -> None:
+    """Write a batch of driver_locations rows (staging-column order) in one COPY."""
+    if not rows:
+        return
+    async with conn.transaction():
+        await conn.execute(DRIVER_LOCATION_STAGING)
+        await conn.copy_records_to_table(
+            "driver_locations_in", records=rows, columns=DRIVER_LOCATION_STAGING_COLUMNS
+        )
+        await conn.execute(DRIVER_LOCATION_MOVE)
+
+
 _last_pg_location_write: Dict[str, datetime] = {}
 PG_LOCATION_WRITE_INTERVAL_S = 10
 
+# Write-back of the latest position per driver/vehicle: one UPDATE per table
+# per consumer batch, joined against unnested parameter arrays.
+DRIVER_POSITION_UPDATE = """
+    UPDATE drivers d
+    SET current_location = ST_SetSRID(ST_MakePoint(u.lng, u.lat), 4326)::geography,
+        location_updated_at = u.at
+    FROM unnest($1::uuid[], $2::float8[], $3::float8[], $4::timestamptz[]) AS u(id, lng, lat, at)
+    WHERE d.id = u.id
+"""
+
+VEHICLE_POSITION_UPDATE = """
+    UPDATE vehicles v
+    SET current_location = ST_SetSRID(ST_MakePoint(u.lng, u.lat), 4326)::geography
+    FROM unnest($1::uuid[], $2::float8[], $3::float8[]) AS u(id, lng, lat)
+    WHERE v.id = u.id
+"""
+
+
+@dataclass
+class TelemetryBatch:
+    """Driver telemetry gathered from one consumer batch, flushed together."""
 
-async def project_driver_location(envelope: EventEnvelope) -> None:
+    rows: List[Tuple] = field(default_factory=list)
+    # driver id -> (lng, lat, written_at, vehicle id); once a driver's write-back
+    # is due, their newest position in the batch is the one written
+    positions: Dict[str, Tuple[float, float, datetime, Optional[str]]] = field(
+        default_factory=dict
+    )
+
+
+def project_driver_location(envelope: EventEnvelope, batch: TelemetryBatch) -> None:
+    """Queue the telemetry row for the batch COPY, and the write-back if due."""
     p = envelope.payload
     loc = p.get("location") or {}
     lat, lng = loc.get("latitude"), loc.get("longitude")
     if lat is None or lng is None:
         return
-    ts = await databases.connect_timescale()
-    await ts.execute(
-        """
-        INSERT INTO driver_locations (time, tenant_id, driver_id, vehicle_id, route_id, location, speed_mph, heading_deg)
-        VALUES ($1, $2, $3, $4, $5, ST_SetSRID(ST_MakePoint($6, $7), 4326)::geography, $8, $9)
-        ON CONFLICT DO NOTHING
-        """,
-        envelope.occurred_at,
-        envelope.tenant_id,
-        p["driverId"],
-        p.get("vehicleId"),
-        p.get("routeId"),
-        lng,
-        lat,
-        p.get("speedMph"),
-        p.get("headingDeg"),
+    batch.rows.append(
+        (
+            envelope.occurred_at,
+            envelope.tenant_id,
+            p["driverId"],
+            p.get("vehicleId"),
+            p.get("routeId"),
+            lng,
+            lat,
+            p.get("speedMph"),
+            p.get("headingDeg"),
+        )
     )
 
     # Rate-limited write-back into the world model (which CDC then observes —
     # one hop, no loop: driver.record-updated events don't update Postgres).
+    # The interval restarts only once flush_telemetry has written it back.
     now = datetime.now(timezone.utc)
-    last = _last_pg_location_write.get(p["driverId"])
-    if last is None or (now - last).total_seconds() >= PG_LOCATION_WRITE_INTERVAL_S:
-        _last_pg_location_write[p["driverId"]] = now
-        pg = await databases.connect_postgres()
-        await pg.execute(
-            """
-            UPDATE drivers SET current_location = ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography,
-                   location_updated_at = $3
-            WHERE id = $4::uuid
-            """,
-            lng,
-            lat,
-            now,
-            p["driverId"],
-        )
-        if p.get("vehicleId"):
-            await pg.execute(
-                """
-                UPDATE vehicles SET current_location = ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography
-                WHERE id = $3::uuid
-                """,
-                lng,
-                lat,
-                p["vehicleId"],
-            )
+    driver_id = p["driverId"]
+    last = _last_pg_location_write.get(driver_id)
+    if (
+        driver_id in batch.positions
+        or last is None
+        or (now - last).total_seconds() >= PG_LOCATION_WRITE_INTERVAL_S
+    ):
+        batch.positions[driver_id] = (lng, lat, now, p.get("vehicleId"))
+
+
+async def flush_telemetry(
+    ts_conn: asyncpg.Connection, pg: asyncpg.Pool, batch: TelemetryBatch
+) -> None:
+    await insert_driver_locations_bulk(ts_conn, batch.rows)
+    if not batch.positions:
+        return
+    drivers = list(batch.positions)
+    lngs = [batch.positions[d][0] for d in drivers]
+    lats = [batch.positions[d][1] for d in drivers]
+    await pg.execute(
+        DRIVER_POSITION_UPDATE, drivers, lngs, lats, [batch.positions[d][2] for d in drivers]
+    )
+    with_vehicle = [(v, lng, lat) for (lng, lat, _, v) in batch.positions.values() if v]
+    if with_vehicle:
+        vehicles, v_lngs, v_lats = (list(c) for c in zip(*with_vehicle))
+        await pg.execute(VEHICLE_POSITION_UPDATE, vehicles, v_lngs, v_lats)
+    for d in drivers:
+        _last_pg_location_write[d] = batch.positions[d][2]
 
 
 # --- graph projection --------------------------------------------------------
@@ -129,168 +251,258 @@ def _s(v: Any) -> Optional[str]:
     return str(v) if v is not None else None
 
 
-async def project_graph(envelope: EventEnvelope) -> None:
-    """Maintain the Neo4j projection from *.record-* observation events."""
-    p = envelope.payload
-    table, op = p.get("table"), p.get("op")
-    row = p.get("after") or p.get("before") or {}
-    node_id = _s(row.get("id"))
-    if not table or not node_id:
+GRAPH_LABELS = {
+    "customers": "Customer", "depots": "Depot", "drivers": "Driver",
+    "vehicles": "Vehicle", "routes": "Route", "orders": "Order",
+    "stops": "Stop", "parcels": "Parcel",
+}
+
+# One UNWIND query per table: a consumer batch becomes one round trip per run
+# of same-table events instead of one to three per event.
+#
+# Relationship targets are MERGEd as placeholder nodes so event order never
+# matters: if a parcel's event arrives before its order's, the order node is
+# created bare and filled in when its own event lands. The FOREACH/CASE guard
+# skips a relationship whose foreign key is null rather than failing the
+# whole batch on a null MERGE.
+GRAPH_UPSERTS = {
+    "customers": """
+        UNWIND $rows AS row
+        MERGE (n:Customer {id: row.id})
+        SET n.name = row.name, n.code = row.code
+    """,
+    "depots": """
+        UNWIND $rows AS row
+        MERGE (n:Depot {id: row.id})
+        SET n.name = row.name
+    """,
+    "drivers": """
+        UNWIND $rows AS row
+        MERGE (n:Driver {id: row.id})
+        SET n.name = row.name, n.driverNumber = row.number, n.status = row.status
+        FOREACH (depotId IN CASE WHEN row.depotId IS NULL THEN [] ELSE [row.depotId] END |
+            MERGE (d:Depot {id: depotId})
+            MERGE (n)-[:BASED_AT]->(d))
+    """,
+    "vehicles": """
+        UNWIND $rows AS row
+        MERGE (n:Vehicle {id: row.id})
+        SET n.vehicleNumber = row.number, n.status = row.status, n.kind = row.kind
+        FOREACH (depotId IN CASE WHEN row.depotId IS NULL THEN [] ELSE [row.depotId] END |
+            MERGE (d:Depot {id: depotId})
+            MERGE (n)-[:BASED_AT]->(d))
+    """,
+    "routes": """
+        UNWIND $rows AS row
+        MERGE (n:Route {id: row.id})
+        SET n.routeNumber = row.number, n.status = row.status, n.serviceDate = row.serviceDate
+        WITH n, row
+        OPTIONAL MATCH (n)-[old:ASSIGNED_TO]->(:Driver) DELETE old
+        WITH DISTINCT n, row
+        OPTIONAL MATCH (n)-[oldv:USES]->(:Vehicle) DELETE oldv
+        WITH DISTINCT n, row
+        FOREACH (driverId IN CASE WHEN row.driverId IS NULL THEN [] ELSE [row.driverId] END |
+            MERGE (d:Driver {id: driverId})
+            MERGE (n)-[:ASSIGNED_TO]->(d))
+        FOREACH (vehicleId IN CASE WHEN row.vehicleId IS NULL THEN [] ELSE [row.vehicleId] END |
+            MERGE (v:Vehicle {id: vehicleId})
+            MERGE (n)-[:USES]->(v))
+    """,
+    "orders": """
+        UNWIND $rows AS row
+        MERGE (n:Order {id: row.id})
+        SET n.orderNumber = row.number, n.status = row.status
+        FOREACH (customerId IN CASE WHEN row.customerId IS NULL THEN [] ELSE [row.customerId] END |
+            MERGE (c:Customer {id: customerId})
+            MERGE (c)-[:PLACED]->(n))
+    """,
+    "stops": """
+        UNWIND $rows AS row
+        MERGE (n:Stop {id: row.id})
+        SET n.kind = row.kind, n.status = row.status, n.sequence = row.sequence, n.address = row.address
+        FOREACH (orderId IN CASE WHEN row.orderId IS NULL THEN [] ELSE [row.orderId] END |
+            MERGE (o:Order {id: orderId})
+            MERGE (n)-[:FOR_ORDER]->(o))
+        WITH n, row
+        OPTIONAL MATCH (:Route)-[old:HAS_STOP]->(n) DELETE old
+        WITH DISTINCT n, row
+        FOREACH (routeId IN CASE WHEN row.routeId IS NULL THEN [] ELSE [row.routeId] END |
+            MERGE (r:Route {id: routeId})
+            MERGE (r)-[:HAS_STOP]->(n))
+    """,
+    "parcels": """
+        UNWIND $rows AS row
+        MERGE (n:Parcel {id: row.id})
+        SET n.barcode = row.barcode, n.status = row.status
+        FOREACH (orderId IN CASE WHEN row.orderId IS NULL THEN [] ELSE [row.orderId] END |
+            MERGE (o:Order {id: orderId})
+            MERGE (o)-[:HAS_PARCEL]->(n))
+    """,
+}
+
+
+# table -> builder of the UNWIND row for one CDC row image. Looked up once
+# per run, not chosen by an if-chain per row.
+GRAPH_PARAMS: Dict[str, Callable[[str, Dict[str, Any]], Dict[str, Any]]] = {
+    "customers": lambda node_id, row: {
+        "id": node_id,
+        "name": row.get("name"),
+        "code": row.get("code"),
+    },
+    "depots": lambda node_id, row: {
+        "id": node_id,
+        "name": row.get("name"),
+    },
+    "drivers": lambda node_id, row: {
+        "id": node_id,
+        "name": f"{row.get('first_name', '')} {row.get('last_name', '')}".strip(),
+        "number": row.get("driver_number"),
+        "status": row.get("status"),
+        "depotId": _s(row.get("home_depot_id")),
+    },
+    "vehicles": lambda node_id, row: {
+        "id": node_id,
+        "number": row.get("vehicle_number"),
+        "status": row.get("status"),
+        "kind": row.get("kind"),
+        "depotId": _s(row.get("home_depot_id")),
+    },
+    "routes": lambda node_id, row: {
+        "id": node_id,
+        "number": row.get("route_number"),
+        "status": row.get("status"),
+        "serviceDate": row.get("service_date"),
+        "driverId": _s(row.get("driver_id")),
+        "vehicleId": _s(row.get("vehicle_id")),
+    },
+    "orders": lambda node_id, row: {
+        "id": node_id,
+        "number": row.get("order_number"),
+        "status": row.get("status"),
+        "customerId": _s(row.get("customer_id")),
+    },
+    "stops": lambda node_id, row: {
+        "id": node_id,
+        "kind": row.get("kind"),
+        "status": row.get("status"),
+        "sequence": row.get("sequence"),
+        "address": row.get("address"),
+        "orderId": _s(row.get("order_id")),
+        "routeId": _s(row.get("route_id")),
+    },
+    "parcels": lambda node_id, row: {
+        "id": node_id,
+        "barcode": row.get("barcode"),
+        "status": row.get("status"),
+        "orderId": _s(row.get("order_id")),
+    },
+}
+
+
+# Stream-ordered runs of (table, deleted?, node id -> latest row image)
+GraphRuns = List[Tuple[str, bool, Dict[str, Dict[str, Any]]]]
+
+
+def _graph_runs(envelopes: List[EventEnvelope]) -> GraphRuns:
+    """Group consecutive *.record-* events on the same table and operation.
+
+    Tables are not independent: upserts MERGE placeholder nodes and
+    relationships on other tables, so a stop upsert followed by its route's
+    delete must stay in that order or the route comes back as a placeholder.
+    A new run therefore starts whenever the table or the operation changes,
+    and runs are written in stream order. CDC rows are full row images, so
+    within a run the last image per id is the state; earlier ones are dropped,
+    which also keeps a node from appearing twice in one UNWIND.
+    """
+    runs: GraphRuns = []
+    for envelope in envelopes:
+        p = envelope.payload
+        table = p.get("table")
+        row = p.get("after") or p.get("before") or {}
+        node_id = _s(row.get("id"))
+        if table not in GRAPH_UPSERTS or not node_id:
+            continue
+        deleted = p.get("op") == "deleted"
+        if not runs or runs[-1][0] != table or runs[-1][1] != deleted:
+            runs.append((table, deleted, {}))
+        runs[-1][2][node_id] = row
+    return runs
+
+
+async def _write_graph_runs(tx: Any, runs: GraphRuns) -> None:
+    for table, deleted, rows in runs:
+        if deleted:
+            result = await tx.run(
+                f"UNWIND $ids AS id MATCH (n:{GRAPH_LABELS[table]} {{id: id}}) DETACH DELETE n",
+                ids=list(rows),
+            )
+        else:
+            params = GRAPH_PARAMS[table]
+            result = await tx.run(
+                GRAPH_UPSERTS[table], rows=[params(i, r) for i, r in rows.items()]
+            )
+        await result.consume()
+
+
+async def project_graph_batch(driver: AsyncDriver, envelopes: List[EventEnvelope]) -> None:
+    """Maintain the Neo4j projection from a batch of *.record-* observation events.
+
+    The whole batch is one write transaction. Every statement is idempotent,
+    so a retried transaction lands in the same state. If it fails on its data,
+    the batch is replayed one row image per transaction, in the same order,
+    so a bad record loses only itself. Losing Neo4j is raised as is.
+    """
+    runs = _graph_runs(envelopes)
+    if not runs:
         return
 
-    driver = await databases.connect_neo4j()
     async with driver.session() as session:
-        if op == "deleted":
-            label = {
-                "customers": "Customer", "depots": "Depot", "drivers": "Driver",
-                "vehicles": "Vehicle", "routes": "Route", "orders": "Order",
-                "stops": "Stop", "parcels": "Parcel",
-            }.get(table)
-            if label:
-                await session.run(f"MATCH (n:{label} {{id: $id}}) DETACH DELETE n", id=node_id)
+        try:
+            await session.execute_write(_write_graph_runs, runs)
             return
-
-        # Relationship targets are MERGEd as placeholder nodes so event order
-        # never matters: if a parcel's event arrives before its order's, the
-        # order node is created bare and filled in when its own event lands.
-        if table == "customers":
-            await session.run(
-                "MERGE (n:Customer {id: $id}) SET n.name = $name, n.code = $code",
-                id=node_id, name=row.get("name"), code=row.get("code"),
-            )
-        elif table == "depots":
-            await session.run(
-                "MERGE (n:Depot {id: $id}) SET n.name = $name",
-                id=node_id, name=row.get("name"),
-            )
-        elif table == "drivers":
-            await session.run(
-                """
-                MERGE (n:Driver {id: $id})
-                SET n.name = $name, n.driverNumber = $number, n.status = $status
-                """,
-                id=node_id,
-                name=f"{row.get('first_name', '')} {row.get('last_name', '')}".strip(),
-                number=row.get("driver_number"),
-                status=row.get("status"),
-            )
-            if row.get("home_depot_id"):
-                await session.run(
-                    """
-                    MATCH (n:Driver {id: $id})
-                    MERGE (d:Depot {id: $depot_id})
-                    MERGE (n)-[:BASED_AT]->(d)
-                    """,
-                    id=node_id, depot_id=_s(row.get("home_depot_id")),
-                )
-        elif table == "vehicles":
-            await session.run(
-                """
-                MERGE (n:Vehicle {id: $id})
-                SET n.vehicleNumber = $number, n.status = $status, n.kind = $kind
-                """,
-                id=node_id,
-                number=row.get("vehicle_number"),
-                status=row.get("status"),
-                kind=row.get("kind"),
-            )
-            if row.get("home_depot_id"):
-                await session.run(
-                    """
-                    MATCH (n:Vehicle {id: $id})
-                    MERGE (d:Depot {id: $depot_id})
-                    MERGE (n)-[:BASED_AT]->(d)
-                    """,
-                    id=node_id, depot_id=_s(row.get("home_depot_id")),
-                )
-        elif table == "routes":
-            await session.run(
-                """
-                MERGE (n:Route {id: $id})
-                SET n.routeNumber = $number, n.status = $status, n.serviceDate = $service_date
-                WITH n
-                OPTIONAL MATCH (n)-[old:ASSIGNED_TO]->(:Driver) DELETE old
-                WITH DISTINCT n
-                OPTIONAL MATCH (n)-[oldv:USES]->(:Vehicle) DELETE oldv
-                """,
-                id=node_id,
-                number=row.get("route_number"),
-                status=row.get("status"),
-                service_date=row.get("service_date"),
-            )
-            if row.get("driver_id"):
-                await session.run(
-                    """
-                    MATCH (n:Route {id: $id})
-                    MERGE (d:Driver {id: $driver_id})
-                    MERGE (n)-[:ASSIGNED_TO]->(d)
-                    """,
-                    id=node_id, driver_id=_s(row.get("driver_id")),
-                )
-            if row.get("vehicle_id"):
-                await session.run(
-                    """
-                    MATCH (n:Route {id: $id})
-                    MERGE (v:Vehicle {id: $vehicle_id})
-                    MERGE (n)-[:USES]->(v)
-                    """,
-                    id=node_id, vehicle_id=_s(row.get("vehicle_id")),
-                )
-        elif table == "orders":
-            await session.run(
-                """
-                MERGE (n:Order {id: $id})
-                SET n.orderNumber = $number, n.status = $status
-                WITH n
-                MERGE (c:Customer {id: $customer_id})
-                MERGE (c)-[:PLACED]->(n)
-                """,
-                id=node_id,
-                number=row.get("order_number"),
-                status=row.get("status"),
-                customer_id=_s(row.get("customer_id")),
-            )
-        elif table == "stops":
-            await session.run(
-                """
-                MERGE (n:Stop {id: $id})
-                SET n.kind = $kind, n.status = $status, n.sequence = $sequence, n.address = $address
-                WITH n
-                MERGE (o:Order {id: $order_id})
-                MERGE (n)-[:FOR_ORDER]->(o)
-                WITH n
-                OPTIONAL MATCH (:Route)-[old:HAS_STOP]->(n) DELETE old
-                """,
-                id=node_id,
-                kind=row.get("kind"),
-                status=row.get("status"),
-                sequence=row.get("sequence"),
-                address=row.get("address"),
-                order_id=_s(row.get("order_id")),
-            )
-            if row.get("route_id"):
-                await session.run(
-                    """
-                    MATCH (n:Stop {id: $id})
-                    MERGE (r:Route {id: $route_id})
-                    MERGE (r)-[:HAS_STOP]->(n)
-                    """,
-                    id=node_id, route_id=_s(row.get("route_id")),
-                )
-        elif table == "parcels":
-            await session.run(
-                """
-                MERGE (n:Parcel {id: $id})
-                SET n.barcode = $barcode, n.status = $status
-                WITH n
-                MERGE (o:Order {id: $order_id})
-                MERGE (o)-[:HAS_PARCEL]->(n)
-                """,
-                id=node_id,
-                barcode=row.get("barcode"),
-                status=row.get("status"),
-                order_id=_s(row.get("order_id")),
+        except GRAPH_CONNECTION_ERRORS:
+            raise
+        except Exception as e:
+            logger.warning(
+                "graph batch of %d events failed (%s); retrying one at a time", len(envelopes), e
             )
+        for table, deleted, rows in runs:
+            for node_id, row in rows.items():
+                try:
+                    await session.execute_write(_write_graph_runs, [(table, deleted, {node_id: row})])
+                except GRAPH_CONNECTION_ERRORS:
+                    raise
+                except Exception as e:
+                    logger.error(
+                        "graph %s of %s %s failed: %s",
+                        "delete" if deleted else "upsert", table, node_id, e,
+                    )
+
+
+async def project_sql_batch(
+    ts: asyncpg.Pool,
+    pg: asyncpg.Pool,
+    envelopes: List[EventEnvelope],
+    telemetry: TelemetryBatch,
+) -> None:
+    """event_stream, then telemetry, on one Timescale connection taken for this batch.
+
+    Taking it per batch, not once per run, means a connection the server
+    dropped is replaced by the pool instead of failing every batch after it.
+    """
+    async with ts.acquire() as ts_conn:
+        try:
+            await write_event_stream(ts_conn, envelopes)
+        except CONNECTION_ERRORS:
+            raise
+        except Exception as e:
+            logger.error("event_stream write of %d events failed: %s", len(envelopes), e)
+        try:
+            await flush_telemetry(ts_conn, pg, telemetry)
+        except CONNECTION_ERRORS:
+            raise
+        except Exception as e:
+            logger.error("telemetry batch of %d rows failed: %s", len(telemetry.rows), e)
 
 
 async def ensure_constraints() -> None:
@@ -302,9 +514,11 @@ async def ensure_constraints() -> None:
 
 
 async def run() -> None:
-    await databases.connect_timescale()
-    await databases.connect_postgres()
+    await databases.connect_all()
     await ensure_constraints()
+    # Resolve the handles once; the per-event path never goes back through
+    # the connect_* coroutines.
+    ts, pg, graph = databases.ts, databases.pg, databases.neo4j
 
     # Groupless, replay-from-earliest: every start rebuilds projections from the
     # whole backbone. Writes are idempotent, so this is safe — and it IS the
@@ -313,23 +527,49 @@ async def run() -> None:
     consumer = build_consumer(CANONICAL_TOPICS, group_id=None, from_beginning=True)
     await consumer.start()
     logger.info("projector replaying %s from the beginning", CANONICAL_TOPICS)
+    # spawn, not fork: the children must not inherit this running event loop.
+    parse_pool = (
+        ProcessPoolExecutor(EVENTBUS_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        if EVENTBUS_PARSE_WORKERS > 0
+        else None
+    )
 
     processed = 0
     try:
-        async for _topic, envelope in envelopes(consumer):
-            try:
-                await write_event_stream(envelope)
-                if envelope.event_type == "driver.location-updated":
-                    await project_driver_location(envelope)
-                elif envelope.event_type.split(".", 1)[1].startswith("record-"):
-                    await project_graph(envelope)
-                processed += 1
-                if processed % 200 == 0:
-                    logger.info("projected %d events", processed)
-            except Exception as e:
-                logger.error("projection error for %s: %s", envelope.event_type, e)
+        async for batch in envelope_batches(consumer, executor=parse_pool):
+            envelopes = [envelope for _topic, envelope in batch]
+
+            # Sort the batch by projection, then write each projection once.
+            telemetry = TelemetryBatch()
+            records: List[EventEnvelope] = []
+            for envelope in envelopes:
+                try:
+                    if envelope.event_type == "driver.location-updated":
+                        project_driver_location(envelope, telemetry)
+                    elif envelope.event_type in RECORD_CHANGE_TYPES:
+                        records.append(envelope)
+                except Exception as e:
+                    logger.error("projection error for %s: %s", envelope.event_type, e)
+
+            # The SQL stores and Neo4j are independent, so their writes overlap.
+            # Both absorb per-record failures themselves; what reaches here is
+            # a lost connection, which ends the run once both sides settle.
+            results = await asyncio.gather(
+                project_sql_batch(ts, pg, envelopes, telemetry),
+                project_graph_batch(graph, records),
+                return_exceptions=True,
+            )
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                raise errors[0]
+
+            before, processed = processed, processed + len(envelopes)
+            if processed // 200 > before // 200:
+                logger.info("projected %d events", processed)
     finally:
         await consumer.stop()
+        if parse_pool is not None:
+            parse_pool.shutdown(cancel_futures=True)
         await databases.close()
 
 
@@ -337,13 +577,12 @@ def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
     while True:
         try:
-            asyncio.run(run())
+            # libuv-backed loop: socket I/O and callback scheduling in C.
+            uvloop.run(run())
         except KeyboardInterrupt:
             break
         except Exception as e:
             logger.error("projector crashed (%s); restarting in 5s", e)
-            import time
-
             time.sleep(5)
 
 
@@ -15,11 +15,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
 import asyncpg
 import httpx
+import uvloop
 
 from core.config import (
     API_BASE_URL,
@@ -31,7 +33,7 @@ from core.config import (
 )
 from core.envelope import EntityRef, EntityType, SourceSystem
 from db.connections import databases
-from eventbus.publisher import EventPublisher
+from eventbus.publisher import EventPublisher, EventValidationError, build_envelope
 
 logger = logging.getLogger(__name__)
 
@@ -118,7 +120,10 @@ async def maybe_auto_start(pg: asyncpg.Pool, api: httpx.AsyncClient) -> None:
 
 async def run() -> None:
     pg = await databases.connect_postgres()
-    publisher = EventPublisher()
+    # This publisher only ever carries location telemetry, which is superseded
+    # by the next tick anyway: a leader ack is durable enough, and a tick no
+    # longer waits on every in-sync replica.
+    publisher = EventPublisher(acks=1)
     await publisher.start()
     sims: Dict[str, DriverSim] = {}
 
@@ -150,6 +155,7 @@ async def run() -> None:
                     await asyncio.sleep(SIM_TICK_SECONDS)
                     continue
 
+            telemetry = []  # this tick's location events, published together
             for route in world["routes"]:
                 driver_id = str(route["driver_id"])
                 route_id = str(route["id"])
@@ -187,8 +193,6 @@ async def run() -> None:
                             resp = await api.post(f"/api/stops/{stop['id']}/status", json={"status": "ARRIVED"})
                             if resp.status_code >= 400:
                                 logger.warning("arrive stop failed: %s", resp.text)
-                            from datetime import timedelta
-
                             sim.dwell_until = wall_now + timedelta(seconds=SIM_DWELL_SECONDS)
                             last_poll = 0
                         except Exception as e:
@@ -198,7 +202,7 @@ async def run() -> None:
                         speed = SIM_SPEED_MPH
 
                 try:
-                    await publisher.emit(
+                    telemetry.append(build_envelope(
                         "driver.location-updated",
                         SourceSystem.SIMULATOR,
                         entity_refs=[
@@ -213,9 +217,21 @@ async def run() -> None:
                             "speedMph": speed,
                             "headingDeg": round(hdg, 1) if hdg is not None else None,
                         },
-                    )
-                except Exception as e:
-                    logger.warning("telemetry emit failed: %s", e)
+                    ))
+                except EventValidationError as e:
+                    logger.warning("telemetry event invalid: %s", e)
+
+            # Fire and forget: the acks arrive while the loop sleeps, and the
+            # next tick's flush() reports any delivery that failed.
+            try:
+                await publisher.flush()
+            except Exception as e:
+                logger.warning("telemetry delivery failed: %s", e)
+            try:
+                for envelope in telemetry:
+                    await publisher.publish(envelope, wait=False)
+            except Exception as e:
+                logger.warning("telemetry emit failed: %s", e)
 
             await asyncio.sleep(SIM_TICK_SECONDS)
 
@@ -224,13 +240,11 @@ def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
     while True:
         try:
-            asyncio.run(run())
+            uvloop.run(run())
         except KeyboardInterrupt:
             break
         except Exception as e:
             logger.error("simulator crashed (%s); restarting in 5s", e)
-            import time
-
             time.sleep(5)
 
 
@@ -10,36 +10,36 @@ TRUNCATE TABLE parcels, stops, orders, routes, vehicles, drivers, depots, custom
 INSERT INTO tenants (id, name) VALUES ('cxt-demo', 'CXT Demo Courier — Austin');
 
 INSERT INTO depots (id, tenant_id, name, address, location) VALUES
-  ('d1000000-0000-4000-8000-000000000001', 'cxt-demo', 'Eastside Depot', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'));
+  ('d1000000-0000-4000-8000-000000000001', 'cxt-demo', 'Eastside Depot', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography);
 
 INSERT INTO customers (id, tenant_id, code, name, contact_name, email, phone, address, location) VALUES
-  ('c1000000-0000-4000-8000-000000000001', 'cxt-demo', 'CAPLAB', 'Capital Diagnostics Lab', 'Dr. Renee Alvarez', 'dispatch@caplab.example.com', '512-555-0201', '3115 Red River St, Austin, TX 78705', ST_GeogFromText('POINT(-97.7305 30.29)')),
-  ('c1000000-0000-4000-8000-000000000002', 'cxt-demo', 'ZILKER', 'Zilker Botanical Supply', 'Tom Herrera', 'dispatch@zilker.example.com', '512-555-0202', '2220 Barton Springs Rd, Austin, TX 78746', ST_GeogFromText('POINT(-97.7688 30.2646)')),
-  ('c1000000-0000-4000-8000-000000000003', 'cxt-demo', 'SOCOOP', 'South Congress Optics', 'Priya Patel', 'dispatch@socoop.example.com', '512-555-0203', '1601 S Congress Ave, Austin, TX 78704', ST_GeogFromText('POINT(-97.7514 30.247)')),
-  ('c1000000-0000-4000-8000-000000000004', 'cxt-demo', 'MUELPH', 'Mueller Community Pharmacy', 'Grace Kim', 'dispatch@muelph.example.com', '512-555-0204', '1910 Aldrich St, Austin, TX 78723', ST_GeogFromText('POINT(-97.7052 30.2996)')),
-  ('c1000000-0000-4000-8000-000000000005', 'cxt-demo', 'HPPRNT', 'Hyde Park Print Works', 'Marcus Bell', 'dispatch@hpprnt.example.com', '512-555-0205', '4315 Guadalupe St, Austin, TX 78751', ST_GeogFromText('POINT(-97.7387 30.3095)')),
-  ('c1000000-0000-4000-8000-000000000006', 'cxt-demo', 'DOMTEC', 'Domain Tech Components', 'Ellen Zhao', 'dispatch@domtec.example.com', '512-555-0206', '11410 Century Oaks Ter, Austin, TX 78758', ST_GeogFromText('POINT(-97.7256 30.4014)')),
-  ('c1000000-0000-4000-8000-000000000007', 'cxt-demo', 'BSCOFF', 'Barton Springs Coffee Roasters', 'Luis Romero', 'dispatch@bscoff.example.com', '512-555-0207', '2201 S Lamar Blvd, Austin, TX 78704', ST_GeogFromText('POINT(-97.7676 30.2493)')),
-  ('c1000000-0000-4000-8000-000000000008', 'cxt-demo', 'RIVAUT', 'Riverside Auto Parts', 'Hank Dawson', 'dispatch@rivaut.example.com', '512-555-0208', '2404 E Riverside Dr, Austin, TX 78741', ST_GeogFromText('POINT(-97.7202 30.2333)')),
-  ('c1000000-0000-4000-8000-000000000009', 'cxt-demo', 'CLKFLR', 'Clarksville Floral Studio', 'Amelie Fontaine', 'dispatch@clkflr.example.com', '512-555-0209', '1211 W 6th St, Austin, TX 78703', ST_GeogFromText('POINT(-97.7565 30.2725)')),
-  ('c1000000-0000-4000-8000-000000000010', 'cxt-demo', 'WPDENT', 'Windsor Park Dental Group', 'Dr. Sam Osei', 'dispatch@wpdent.example.com', '512-555-0210', '5811 Berkman Dr, Austin, TX 78723', ST_GeogFromText('POINT(-97.6927 30.3159)'));
+  ('c1000000-0000-4000-8000-000000000001', 'cxt-demo', 'CAPLAB', 'Capital Diagnostics Lab', 'Dr. Renee Alvarez', 'dispatch@caplab.example.com', '512-555-0201', '3115 Red River St, Austin, TX 78705', ST_SetSRID(ST_MakePoint(-97.7305, 30.29), 4326)::geography),
+  ('c1000000-0000-4000-8000-000000000002', 'cxt-demo', 'ZILKER', 'Zilker Botanical Supply', 'Tom Herrera', 'dispatch@zilker.example.com', '512-555-0202', '2220 Barton Springs Rd, Austin, TX 78746', ST_SetSRID(ST_MakePoint(-97.7688, 30.2646), 4326)::geography),
+  ('c1000000-0000-4000-8000-000000000003', 'cxt-demo', 'SOCOOP', 'South Congress Optics', 'Priya Patel', 'dispatch@socoop.example.com', '512-555-0203', '1601 S Congress Ave, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7514, 30.247), 4326)::geography),
+  ('c1000000-0000-4000-8000-000000000004', 'cxt-demo', 'MUELPH', 'Mueller Community Pharmacy', 'Grace Kim', 'dispatch@muelph.example.com', '512-555-0204', '1910 Aldrich St, Austin, TX 78723', ST_SetSRID(ST_MakePoint(-97.7052, 30.2996), 4326)::geography),
+  ('c1000000-0000-4000-8000-000000000005', 'cxt-demo', 'HPPRNT', 'Hyde Park Print Works', 'Marcus Bell', 'dispatch@hpprnt.example.com', '512-555-0205', '4315 Guadalupe St, Austin, TX 78751', ST_SetSRID(ST_MakePoint(-97.7387, 30.3095), 4326)::geography),
+  ('c1000000-0000-4000-8000-000000000006', 'cxt-demo', 'DOMTEC', 'Domain Tech Components', 'Ellen Zhao', 'dispatch@domtec.example.com', '512-555-0206', '11410 Century Oaks Ter, Austin, TX 78758', ST_SetSRID(ST_MakePoint(-97.7256, 30.4014), 4326)::geography),
+  ('c1000000-0000-4000-8000-000000000007', 'cxt-demo', 'BSCOFF', 'Barton Springs Coffee Roasters', 'Luis Romero', 'dispatch@bscoff.example.com', '512-555-0207', '2201 S Lamar Blvd, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7676, 30.2493), 4326)::geography),
+  ('c1000000-0000-4000-8000-000000000008', 'cxt-demo', 'RIVAUT', 'Riverside Auto Parts', 'Hank Dawson', 'dispatch@rivaut.example.com', '512-555-0208', '2404 E Riverside Dr, Austin, TX 78741', ST_SetSRID(ST_MakePoint(-97.7202, 30.2333), 4326)::geography),
+  ('c1000000-0000-4000-8000-000000000009', 'cxt-demo', 'CLKFLR', 'Clarksville Floral Studio', 'Amelie Fontaine', 'dispatch@clkflr.example.com', '512-555-0209', '1211 W 6th St, Austin, TX 78703', ST_SetSRID(ST_MakePoint(-97.7565, 30.2725), 4326)::geography),
+  ('c1000000-0000-4000-8000-000000000010', 'cxt-demo', 'WPDENT', 'Windsor Park Dental Group', 'Dr. Sam Osei', 'dispatch@wpdent.example.com', '512-555-0210', '5811 Berkman Dr, Austin, TX 78723', ST_SetSRID(ST_MakePoint(-97.6927, 30.3159), 4326)::geography);
 
 INSERT INTO drivers (id, tenant_id, driver_number, first_name, last_name, phone, email, status, home_depot_id, current_location, location_updated_at) VALUES
-  ('d2000000-0000-4000-8000-000000000001', 'cxt-demo', 'DRV-001', 'Maria', 'Garcia', '512-555-0101', 'maria.garcia@cxtdemo.example.com', 'ON_ROUTE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)'), NOW()),
-  ('d2000000-0000-4000-8000-000000000002', 'cxt-demo', 'DRV-002', 'Carlos', 'Rodriguez', '512-555-0102', 'carlos.rodriguez@cxtdemo.example.com', 'ON_ROUTE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7157 30.2593)'), NOW()),
-  ('d2000000-0000-4000-8000-000000000003', 'cxt-demo', 'DRV-003', 'Aisha', 'Johnson', '512-555-0103', 'aisha.johnson@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)'), NOW()),
-  ('d2000000-0000-4000-8000-000000000004', 'cxt-demo', 'DRV-004', 'Robert', 'Wilson', '512-555-0104', 'robert.wilson@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)'), NOW()),
-  ('d2000000-0000-4000-8000-000000000005', 'cxt-demo', 'DRV-005', 'Emily', 'Chen', '512-555-0105', 'emily.chen@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)'), NOW()),
-  ('d2000000-0000-4000-8000-000000000006', 'cxt-demo', 'DRV-006', 'David', 'Okafor', '512-555-0106', 'david.okafor@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)'), NOW()),
-  ('d2000000-0000-4000-8000-000000000007', 'cxt-demo', 'DRV-007', 'Sarah', 'Nguyen', '512-555-0107', 'sarah.nguyen@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)'), NOW()),
-  ('d2000000-0000-4000-8000-000000000008', 'cxt-demo', 'DRV-008', 'James', 'Miller', '512-555-0108', 'james.miller@cxtdemo.example.com', 'OFF_DUTY', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)'), NOW());
+  ('d2000000-0000-4000-8000-000000000001', 'cxt-demo', 'DRV-001', 'Maria', 'Garcia', '512-555-0101', 'maria.garcia@cxtdemo.example.com', 'ON_ROUTE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, NOW()),
+  ('d2000000-0000-4000-8000-000000000002', 'cxt-demo', 'DRV-002', 'Carlos', 'Rodriguez', '512-555-0102', 'carlos.rodriguez@cxtdemo.example.com', 'ON_ROUTE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7157, 30.2593), 4326)::geography, NOW()),
+  ('d2000000-0000-4000-8000-000000000003', 'cxt-demo', 'DRV-003', 'Aisha', 'Johnson', '512-555-0103', 'aisha.johnson@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, NOW()),
+  ('d2000000-0000-4000-8000-000000000004', 'cxt-demo', 'DRV-004', 'Robert', 'Wilson', '512-555-0104', 'robert.wilson@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, NOW()),
+  ('d2000000-0000-4000-8000-000000000005', 'cxt-demo', 'DRV-005', 'Emily', 'Chen', '512-555-0105', 'emily.chen@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, NOW()),
+  ('d2000000-0000-4000-8000-000000000006', 'cxt-demo', 'DRV-006', 'David', 'Okafor', '512-555-0106', 'david.okafor@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, NOW()),
+  ('d2000000-0000-4000-8000-000000000007', 'cxt-demo', 'DRV-007', 'Sarah', 'Nguyen', '512-555-0107', 'sarah.nguyen@cxtdemo.example.com', 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, NOW()),
+  ('d2000000-0000-4000-8000-000000000008', 'cxt-demo', 'DRV-008', 'James', 'Miller', '512-555-0108', 'james.miller@cxtdemo.example.com', 'OFF_DUTY', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, NOW());
 
 INSERT INTO vehicles (id, tenant_id, vehicle_number, kind, make, model, capacity_parcels, status, home_depot_id, current_location) VALUES
-  ('e1000000-0000-4000-8000-000000000001', 'cxt-demo', 'VAN-101', 'VAN', 'Ford', 'Transit 350', 60, 'IN_SERVICE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)')),
-  ('e1000000-0000-4000-8000-000000000002', 'cxt-demo', 'VAN-102', 'VAN', 'Mercedes-Benz', 'Sprinter 2500', 55, 'IN_SERVICE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7157 30.2593)')),
-  ('e1000000-0000-4000-8000-000000000003', 'cxt-demo', 'VAN-103', 'VAN', 'RAM', 'ProMaster 2500', 50, 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)')),
-  ('e1000000-0000-4000-8000-000000000004', 'cxt-demo', 'VAN-104', 'VAN', 'Ford', 'Transit 250', 45, 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)')),
-  ('e1000000-0000-4000-8000-000000000005', 'cxt-demo', 'BOX-105', 'BOX_TRUCK', 'Isuzu', 'NPR-HD', 120, 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_GeogFromText('POINT(-97.7185 30.2601)'));
+  ('e1000000-0000-4000-8000-000000000001', 'cxt-demo', 'VAN-101', 'VAN', 'Ford', 'Transit 350', 60, 'IN_SERVICE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography),
+  ('e1000000-0000-4000-8000-000000000002', 'cxt-demo', 'VAN-102', 'VAN', 'Mercedes-Benz', 'Sprinter 2500', 55, 'IN_SERVICE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7157, 30.2593), 4326)::geography),
+  ('e1000000-0000-4000-8000-000000000003', 'cxt-demo', 'VAN-103', 'VAN', 'RAM', 'ProMaster 2500', 50, 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography),
+  ('e1000000-0000-4000-8000-000000000004', 'cxt-demo', 'VAN-104', 'VAN', 'Ford', 'Transit 250', 45, 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography),
+  ('e1000000-0000-4000-8000-000000000005', 'cxt-demo', 'BOX-105', 'BOX_TRUCK', 'Isuzu', 'NPR-HD', 120, 'AVAILABLE', 'd1000000-0000-4000-8000-000000000001', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography);
 
 INSERT INTO routes (id, tenant_id, route_number, service_date, status, driver_id, vehicle_id, started_at) VALUES
   ('a1000000-0000-4000-8000-000000000001', 'cxt-demo', 'RT-101', CURRENT_DATE, 'ACTIVE', 'd2000000-0000-4000-8000-000000000001', 'e1000000-0000-4000-8000-000000000001', (CURRENT_DATE + TIME '08:00' + INTERVAL '0 minutes')),
@@ -81,66 +81,66 @@ INSERT INTO orders (id, tenant_id, order_number, customer_id, status, service_le
   ('b1000000-0000-4000-8000-000000000030', 'cxt-demo', 'ORD-1030', 'c1000000-0000-4000-8000-000000000003', 'CREATED', 'RUSH', NULL);
 
 INSERT INTO stops (id, tenant_id, order_id, route_id, kind, sequence, status, address, location, window_start, window_end, arrived_at, completed_at) VALUES
-  ('b2000000-0000-4000-8000-000000000011', 'cxt-demo', 'b1000000-0000-4000-8000-000000000001', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 1, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '0 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '120 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '3 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '5 minutes')),
-  ('b2000000-0000-4000-8000-000000000012', 'cxt-demo', 'b1000000-0000-4000-8000-000000000001', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 7, 'PENDING', '904 West Ave, Austin, TX 78701', ST_GeogFromText('POINT(-97.7484 30.2734)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '90 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000021', 'cxt-demo', 'b1000000-0000-4000-8000-000000000002', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 2, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '0 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '120 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '8 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '10 minutes')),
-  ('b2000000-0000-4000-8000-000000000022', 'cxt-demo', 'b1000000-0000-4000-8000-000000000002', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 8, 'PENDING', '807 W Mary St, Austin, TX 78704', ST_GeogFromText('POINT(-97.7583 30.2489)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '60 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000031', 'cxt-demo', 'b1000000-0000-4000-8000-000000000003', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 3, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '10 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '130 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '13 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '15 minutes')),
-  ('b2000000-0000-4000-8000-000000000032', 'cxt-demo', 'b1000000-0000-4000-8000-000000000003', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 10, 'PENDING', '3809 Duval St, Austin, TX 78751', ST_GeogFromText('POINT(-97.7288 30.3037)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '70 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000041', 'cxt-demo', 'b1000000-0000-4000-8000-000000000004', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 4, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '10 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '130 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '18 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes')),
-  ('b2000000-0000-4000-8000-000000000042', 'cxt-demo', 'b1000000-0000-4000-8000-000000000004', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 9, 'PENDING', '1200 Barton Hills Dr, Austin, TX 78704', ST_GeogFromText('POINT(-97.7789 30.2547)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '50 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '170 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000051', 'cxt-demo', 'b1000000-0000-4000-8000-000000000005', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 5, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '23 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '25 minutes')),
-  ('b2000000-0000-4000-8000-000000000052', 'cxt-demo', 'b1000000-0000-4000-8000-000000000005', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 6, 'PENDING', '600 Congress Ave, Austin, TX 78701', ST_GeogFromText('POINT(-97.7431 30.268)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '80 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000061', 'cxt-demo', 'b1000000-0000-4000-8000-000000000006', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 1, 'COMPLETED', '2220 Barton Springs Rd, Austin, TX 78746', ST_GeogFromText('POINT(-97.7688 30.2646)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '3 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '5 minutes')),
-  ('b2000000-0000-4000-8000-000000000062', 'cxt-demo', 'b1000000-0000-4000-8000-000000000006', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 9, 'PENDING', '2604 S 5th St, Austin, TX 78704', ST_GeogFromText('POINT(-97.7644 30.2372)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '80 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000071', 'cxt-demo', 'b1000000-0000-4000-8000-000000000007', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 2, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '30 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '150 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '8 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '10 minutes')),
-  ('b2000000-0000-4000-8000-000000000072', 'cxt-demo', 'b1000000-0000-4000-8000-000000000007', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 7, 'PENDING', '1401 Rosewood Ave, Austin, TX 78702', ST_GeogFromText('POINT(-97.7229 30.2683)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '90 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '330 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000081', 'cxt-demo', 'b1000000-0000-4000-8000-000000000008', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 3, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '30 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '150 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '13 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '15 minutes')),
-  ('b2000000-0000-4000-8000-000000000082', 'cxt-demo', 'b1000000-0000-4000-8000-000000000008', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 10, 'PENDING', '1304 E 51st St, Austin, TX 78723', ST_GeogFromText('POINT(-97.7099 30.3054)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '90 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '330 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000091', 'cxt-demo', 'b1000000-0000-4000-8000-000000000009', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 4, 'COMPLETED', '2404 E Riverside Dr, Austin, TX 78741', ST_GeogFromText('POINT(-97.7202 30.2333)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '40 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '160 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '18 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes')),
-  ('b2000000-0000-4000-8000-000000000092', 'cxt-demo', 'b1000000-0000-4000-8000-000000000009', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 8, 'PENDING', '400 E Riverside Dr, Austin, TX 78704', ST_GeogFromText('POINT(-97.7401 30.2447)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '80 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '200 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000101', 'cxt-demo', 'b1000000-0000-4000-8000-000000000010', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 5, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '40 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '160 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '23 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '25 minutes')),
-  ('b2000000-0000-4000-8000-000000000102', 'cxt-demo', 'b1000000-0000-4000-8000-000000000010', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 6, 'COMPLETED', '2200 E 7th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7157 30.2593)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '100 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '340 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '28 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '30 minutes')),
-  ('b2000000-0000-4000-8000-000000000111', 'cxt-demo', 'b1000000-0000-4000-8000-000000000011', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 1, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '120 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '270 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000112', 'cxt-demo', 'b1000000-0000-4000-8000-000000000011', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 8, 'PENDING', '5300 Airport Blvd, Austin, TX 78751', ST_GeogFromText('POINT(-97.7126 30.3131)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '210 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000121', 'cxt-demo', 'b1000000-0000-4000-8000-000000000012', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 2, 'PENDING', '3115 Red River St, Austin, TX 78705', ST_GeogFromText('POINT(-97.7305 30.29)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '120 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '270 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000122', 'cxt-demo', 'b1000000-0000-4000-8000-000000000012', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 7, 'PENDING', '4200 Red River St, Austin, TX 78751', ST_GeogFromText('POINT(-97.7245 30.3013)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '210 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000131', 'cxt-demo', 'b1000000-0000-4000-8000-000000000013', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 3, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '130 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '280 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000132', 'cxt-demo', 'b1000000-0000-4000-8000-000000000013', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 10, 'PENDING', '2525 W Anderson Ln, Austin, TX 78757', ST_GeogFromText('POINT(-97.7317 30.3593)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '190 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '460 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000141', 'cxt-demo', 'b1000000-0000-4000-8000-000000000014', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 4, 'PENDING', '11410 Century Oaks Ter, Austin, TX 78758', ST_GeogFromText('POINT(-97.7256 30.4014)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '130 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '280 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000142', 'cxt-demo', 'b1000000-0000-4000-8000-000000000014', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 9, 'PENDING', '500 E Anderson Ln, Austin, TX 78752', ST_GeogFromText('POINT(-97.7043 30.3541)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '190 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '460 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000151', 'cxt-demo', 'b1000000-0000-4000-8000-000000000015', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 5, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '290 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000152', 'cxt-demo', 'b1000000-0000-4000-8000-000000000015', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 6, 'PENDING', '1601 E 38th 1/2 St, Austin, TX 78722', ST_GeogFromText('POINT(-97.7194 30.2969)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '200 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '470 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000161', 'cxt-demo', 'b1000000-0000-4000-8000-000000000016', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 1, 'PENDING', '4315 Guadalupe St, Austin, TX 78751', ST_GeogFromText('POINT(-97.7387 30.3095)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '150 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000162', 'cxt-demo', 'b1000000-0000-4000-8000-000000000016', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 7, 'PENDING', '2002 Manor Rd, Austin, TX 78722', ST_GeogFromText('POINT(-97.7186 30.2841)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '210 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '480 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000171', 'cxt-demo', 'b1000000-0000-4000-8000-000000000017', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 2, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '150 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000172', 'cxt-demo', 'b1000000-0000-4000-8000-000000000017', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 6, 'PENDING', '1804 E Cesar Chavez St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7228 30.256)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '190 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000181', 'cxt-demo', 'b1000000-0000-4000-8000-000000000018', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 3, 'PENDING', '2201 S Lamar Blvd, Austin, TX 78704', ST_GeogFromText('POINT(-97.7676 30.2493)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '160 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000182', 'cxt-demo', 'b1000000-0000-4000-8000-000000000018', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 10, 'PENDING', '5400 Manchaca Rd, Austin, TX 78745', ST_GeogFromText('POINT(-97.7965 30.2172)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '220 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '490 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000191', 'cxt-demo', 'b1000000-0000-4000-8000-000000000019', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 4, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '160 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000192', 'cxt-demo', 'b1000000-0000-4000-8000-000000000019', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 8, 'PENDING', '4700 Grover Ave, Austin, TX 78756', ST_GeogFromText('POINT(-97.7419 30.3178)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '220 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '490 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000201', 'cxt-demo', 'b1000000-0000-4000-8000-000000000020', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 5, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '170 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000202', 'cxt-demo', 'b1000000-0000-4000-8000-000000000020', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 9, 'PENDING', '3300 Bee Caves Rd, Austin, TX 78746', ST_GeogFromText('POINT(-97.8018 30.2731)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '230 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '500 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000211', 'cxt-demo', 'b1000000-0000-4000-8000-000000000021', 'a1000000-0000-4000-8000-000000000005', 'PICKUP', 1, 'PENDING', '5811 Berkman Dr, Austin, TX 78723', ST_GeogFromText('POINT(-97.6927 30.3159)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '180 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '330 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000212', 'cxt-demo', 'b1000000-0000-4000-8000-000000000021', 'a1000000-0000-4000-8000-000000000005', 'DELIVERY', 5, 'PENDING', '901 W Ben White Blvd, Austin, TX 78704', ST_GeogFromText('POINT(-97.7756 30.2278)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '240 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '510 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000221', 'cxt-demo', 'b1000000-0000-4000-8000-000000000022', 'a1000000-0000-4000-8000-000000000005', 'PICKUP', 2, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '180 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '330 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000222', 'cxt-demo', 'b1000000-0000-4000-8000-000000000022', 'a1000000-0000-4000-8000-000000000005', 'DELIVERY', 6, 'PENDING', '6800 Burnet Rd, Austin, TX 78757', ST_GeogFromText('POINT(-97.7405 30.3437)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '240 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '510 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000231', 'cxt-demo', 'b1000000-0000-4000-8000-000000000023', 'a1000000-0000-4000-8000-000000000005', 'PICKUP', 3, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '190 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '340 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000232', 'cxt-demo', 'b1000000-0000-4000-8000-000000000023', 'a1000000-0000-4000-8000-000000000005', 'DELIVERY', 4, 'PENDING', '1913 E 12th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7176 30.2735)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '230 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '350 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000241', 'cxt-demo', 'b1000000-0000-4000-8000-000000000024', NULL, 'PICKUP', NULL, 'PENDING', '2220 Barton Springs Rd, Austin, TX 78746', ST_GeogFromText('POINT(-97.7688 30.2646)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '240 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '420 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000242', 'cxt-demo', 'b1000000-0000-4000-8000-000000000024', NULL, 'DELIVERY', NULL, 'PENDING', '3401 Cherrywood Rd, Austin, TX 78722', ST_GeogFromText('POINT(-97.7146 30.2926)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '600 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000251', 'cxt-demo', 'b1000000-0000-4000-8000-000000000025', NULL, 'PICKUP', NULL, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '240 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '420 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000252', 'cxt-demo', 'b1000000-0000-4000-8000-000000000025', NULL, 'DELIVERY', NULL, 'PENDING', '1100 S Lamar Blvd, Austin, TX 78704', ST_GeogFromText('POINT(-97.7635 30.2559)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '600 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000261', 'cxt-demo', 'b1000000-0000-4000-8000-000000000026', NULL, 'PICKUP', NULL, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '250 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '430 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000262', 'cxt-demo', 'b1000000-0000-4000-8000-000000000026', NULL, 'DELIVERY', NULL, 'PENDING', '7301 Woodrow Ave, Austin, TX 78757', ST_GeogFromText('POINT(-97.7326 30.3474)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '270 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '340 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000271', 'cxt-demo', 'b1000000-0000-4000-8000-000000000027', NULL, 'PICKUP', NULL, 'PENDING', '2404 E Riverside Dr, Austin, TX 78741', ST_GeogFromText('POINT(-97.7202 30.2333)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '250 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '430 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000272', 'cxt-demo', 'b1000000-0000-4000-8000-000000000027', NULL, 'DELIVERY', NULL, 'PENDING', '1717 Toomey Rd, Austin, TX 78704', ST_GeogFromText('POINT(-97.7615 30.2617)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '290 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '410 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000281', 'cxt-demo', 'b1000000-0000-4000-8000-000000000028', NULL, 'PICKUP', NULL, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '260 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '440 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000282', 'cxt-demo', 'b1000000-0000-4000-8000-000000000028', NULL, 'DELIVERY', NULL, 'PENDING', '5555 N Lamar Blvd, Austin, TX 78751', ST_GeogFromText('POINT(-97.7267 30.3221)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '620 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000291', 'cxt-demo', 'b1000000-0000-4000-8000-000000000029', NULL, 'PICKUP', NULL, 'PENDING', '1211 W 6th St, Austin, TX 78703', ST_GeogFromText('POINT(-97.7565 30.2725)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '260 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '440 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000292', 'cxt-demo', 'b1000000-0000-4000-8000-000000000029', NULL, 'DELIVERY', NULL, 'PENDING', '3663 Bee Caves Rd, Austin, TX 78746', ST_GeogFromText('POINT(-97.809 30.2705)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '620 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000301', 'cxt-demo', 'b1000000-0000-4000-8000-000000000030', NULL, 'PICKUP', NULL, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_GeogFromText('POINT(-97.7185 30.2601)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '270 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '450 minutes'), NULL, NULL),
-  ('b2000000-0000-4000-8000-000000000302', 'cxt-demo', 'b1000000-0000-4000-8000-000000000030', NULL, 'DELIVERY', NULL, 'PENDING', '2901 Montopolis Dr, Austin, TX 78741', ST_GeogFromText('POINT(-97.704 30.2287)'), (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '430 minutes'), NULL, NULL);
+  ('b2000000-0000-4000-8000-000000000011', 'cxt-demo', 'b1000000-0000-4000-8000-000000000001', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 1, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '0 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '120 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '3 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '5 minutes')),
+  ('b2000000-0000-4000-8000-000000000012', 'cxt-demo', 'b1000000-0000-4000-8000-000000000001', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 7, 'PENDING', '904 West Ave, Austin, TX 78701', ST_SetSRID(ST_MakePoint(-97.7484, 30.2734), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '90 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000021', 'cxt-demo', 'b1000000-0000-4000-8000-000000000002', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 2, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '0 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '120 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '8 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '10 minutes')),
+  ('b2000000-0000-4000-8000-000000000022', 'cxt-demo', 'b1000000-0000-4000-8000-000000000002', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 8, 'PENDING', '807 W Mary St, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7583, 30.2489), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '60 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000031', 'cxt-demo', 'b1000000-0000-4000-8000-000000000003', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 3, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '10 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '130 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '13 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '15 minutes')),
+  ('b2000000-0000-4000-8000-000000000032', 'cxt-demo', 'b1000000-0000-4000-8000-000000000003', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 10, 'PENDING', '3809 Duval St, Austin, TX 78751', ST_SetSRID(ST_MakePoint(-97.7288, 30.3037), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '70 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000041', 'cxt-demo', 'b1000000-0000-4000-8000-000000000004', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 4, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '10 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '130 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '18 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes')),
+  ('b2000000-0000-4000-8000-000000000042', 'cxt-demo', 'b1000000-0000-4000-8000-000000000004', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 9, 'PENDING', '1200 Barton Hills Dr, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7789, 30.2547), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '50 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '170 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000051', 'cxt-demo', 'b1000000-0000-4000-8000-000000000005', 'a1000000-0000-4000-8000-000000000001', 'PICKUP', 5, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '23 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '25 minutes')),
+  ('b2000000-0000-4000-8000-000000000052', 'cxt-demo', 'b1000000-0000-4000-8000-000000000005', 'a1000000-0000-4000-8000-000000000001', 'DELIVERY', 6, 'PENDING', '600 Congress Ave, Austin, TX 78701', ST_SetSRID(ST_MakePoint(-97.7431, 30.268), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '80 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000061', 'cxt-demo', 'b1000000-0000-4000-8000-000000000006', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 1, 'COMPLETED', '2220 Barton Springs Rd, Austin, TX 78746', ST_SetSRID(ST_MakePoint(-97.7688, 30.2646), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '3 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '5 minutes')),
+  ('b2000000-0000-4000-8000-000000000062', 'cxt-demo', 'b1000000-0000-4000-8000-000000000006', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 9, 'PENDING', '2604 S 5th St, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7644, 30.2372), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '80 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000071', 'cxt-demo', 'b1000000-0000-4000-8000-000000000007', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 2, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '30 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '150 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '8 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '10 minutes')),
+  ('b2000000-0000-4000-8000-000000000072', 'cxt-demo', 'b1000000-0000-4000-8000-000000000007', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 7, 'PENDING', '1401 Rosewood Ave, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7229, 30.2683), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '90 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '330 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000081', 'cxt-demo', 'b1000000-0000-4000-8000-000000000008', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 3, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '30 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '150 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '13 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '15 minutes')),
+  ('b2000000-0000-4000-8000-000000000082', 'cxt-demo', 'b1000000-0000-4000-8000-000000000008', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 10, 'PENDING', '1304 E 51st St, Austin, TX 78723', ST_SetSRID(ST_MakePoint(-97.7099, 30.3054), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '90 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '330 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000091', 'cxt-demo', 'b1000000-0000-4000-8000-000000000009', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 4, 'COMPLETED', '2404 E Riverside Dr, Austin, TX 78741', ST_SetSRID(ST_MakePoint(-97.7202, 30.2333), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '40 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '160 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '18 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '20 minutes')),
+  ('b2000000-0000-4000-8000-000000000092', 'cxt-demo', 'b1000000-0000-4000-8000-000000000009', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 8, 'PENDING', '400 E Riverside Dr, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7401, 30.2447), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '80 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '200 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000101', 'cxt-demo', 'b1000000-0000-4000-8000-000000000010', 'a1000000-0000-4000-8000-000000000002', 'PICKUP', 5, 'COMPLETED', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '40 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '160 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '23 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '25 minutes')),
+  ('b2000000-0000-4000-8000-000000000102', 'cxt-demo', 'b1000000-0000-4000-8000-000000000010', 'a1000000-0000-4000-8000-000000000002', 'DELIVERY', 6, 'COMPLETED', '2200 E 7th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7157, 30.2593), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '100 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '340 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '28 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '30 minutes')),
+  ('b2000000-0000-4000-8000-000000000111', 'cxt-demo', 'b1000000-0000-4000-8000-000000000011', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 1, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '120 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '270 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000112', 'cxt-demo', 'b1000000-0000-4000-8000-000000000011', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 8, 'PENDING', '5300 Airport Blvd, Austin, TX 78751', ST_SetSRID(ST_MakePoint(-97.7126, 30.3131), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '210 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000121', 'cxt-demo', 'b1000000-0000-4000-8000-000000000012', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 2, 'PENDING', '3115 Red River St, Austin, TX 78705', ST_SetSRID(ST_MakePoint(-97.7305, 30.29), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '120 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '270 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000122', 'cxt-demo', 'b1000000-0000-4000-8000-000000000012', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 7, 'PENDING', '4200 Red River St, Austin, TX 78751', ST_SetSRID(ST_MakePoint(-97.7245, 30.3013), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '210 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000131', 'cxt-demo', 'b1000000-0000-4000-8000-000000000013', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 3, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '130 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '280 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000132', 'cxt-demo', 'b1000000-0000-4000-8000-000000000013', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 10, 'PENDING', '2525 W Anderson Ln, Austin, TX 78757', ST_SetSRID(ST_MakePoint(-97.7317, 30.3593), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '190 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '460 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000141', 'cxt-demo', 'b1000000-0000-4000-8000-000000000014', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 4, 'PENDING', '11410 Century Oaks Ter, Austin, TX 78758', ST_SetSRID(ST_MakePoint(-97.7256, 30.4014), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '130 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '280 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000142', 'cxt-demo', 'b1000000-0000-4000-8000-000000000014', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 9, 'PENDING', '500 E Anderson Ln, Austin, TX 78752', ST_SetSRID(ST_MakePoint(-97.7043, 30.3541), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '190 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '460 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000151', 'cxt-demo', 'b1000000-0000-4000-8000-000000000015', 'a1000000-0000-4000-8000-000000000003', 'PICKUP', 5, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '140 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '290 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000152', 'cxt-demo', 'b1000000-0000-4000-8000-000000000015', 'a1000000-0000-4000-8000-000000000003', 'DELIVERY', 6, 'PENDING', '1601 E 38th 1/2 St, Austin, TX 78722', ST_SetSRID(ST_MakePoint(-97.7194, 30.2969), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '200 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '470 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000161', 'cxt-demo', 'b1000000-0000-4000-8000-000000000016', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 1, 'PENDING', '4315 Guadalupe St, Austin, TX 78751', ST_SetSRID(ST_MakePoint(-97.7387, 30.3095), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '150 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000162', 'cxt-demo', 'b1000000-0000-4000-8000-000000000016', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 7, 'PENDING', '2002 Manor Rd, Austin, TX 78722', ST_SetSRID(ST_MakePoint(-97.7186, 30.2841), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '210 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '480 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000171', 'cxt-demo', 'b1000000-0000-4000-8000-000000000017', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 2, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '150 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000172', 'cxt-demo', 'b1000000-0000-4000-8000-000000000017', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 6, 'PENDING', '1804 E Cesar Chavez St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7228, 30.256), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '190 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000181', 'cxt-demo', 'b1000000-0000-4000-8000-000000000018', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 3, 'PENDING', '2201 S Lamar Blvd, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7676, 30.2493), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '160 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000182', 'cxt-demo', 'b1000000-0000-4000-8000-000000000018', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 10, 'PENDING', '5400 Manchaca Rd, Austin, TX 78745', ST_SetSRID(ST_MakePoint(-97.7965, 30.2172), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '220 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '490 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000191', 'cxt-demo', 'b1000000-0000-4000-8000-000000000019', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 4, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '160 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000192', 'cxt-demo', 'b1000000-0000-4000-8000-000000000019', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 8, 'PENDING', '4700 Grover Ave, Austin, TX 78756', ST_SetSRID(ST_MakePoint(-97.7419, 30.3178), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '220 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '490 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000201', 'cxt-demo', 'b1000000-0000-4000-8000-000000000020', 'a1000000-0000-4000-8000-000000000004', 'PICKUP', 5, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '170 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000202', 'cxt-demo', 'b1000000-0000-4000-8000-000000000020', 'a1000000-0000-4000-8000-000000000004', 'DELIVERY', 9, 'PENDING', '3300 Bee Caves Rd, Austin, TX 78746', ST_SetSRID(ST_MakePoint(-97.8018, 30.2731), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '230 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '500 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000211', 'cxt-demo', 'b1000000-0000-4000-8000-000000000021', 'a1000000-0000-4000-8000-000000000005', 'PICKUP', 1, 'PENDING', '5811 Berkman Dr, Austin, TX 78723', ST_SetSRID(ST_MakePoint(-97.6927, 30.3159), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '180 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '330 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000212', 'cxt-demo', 'b1000000-0000-4000-8000-000000000021', 'a1000000-0000-4000-8000-000000000005', 'DELIVERY', 5, 'PENDING', '901 W Ben White Blvd, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7756, 30.2278), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '240 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '510 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000221', 'cxt-demo', 'b1000000-0000-4000-8000-000000000022', 'a1000000-0000-4000-8000-000000000005', 'PICKUP', 2, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '180 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '330 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000222', 'cxt-demo', 'b1000000-0000-4000-8000-000000000022', 'a1000000-0000-4000-8000-000000000005', 'DELIVERY', 6, 'PENDING', '6800 Burnet Rd, Austin, TX 78757', ST_SetSRID(ST_MakePoint(-97.7405, 30.3437), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '240 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '510 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000231', 'cxt-demo', 'b1000000-0000-4000-8000-000000000023', 'a1000000-0000-4000-8000-000000000005', 'PICKUP', 3, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '190 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '340 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000232', 'cxt-demo', 'b1000000-0000-4000-8000-000000000023', 'a1000000-0000-4000-8000-000000000005', 'DELIVERY', 4, 'PENDING', '1913 E 12th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7176, 30.2735), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '230 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '350 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000241', 'cxt-demo', 'b1000000-0000-4000-8000-000000000024', NULL, 'PICKUP', NULL, 'PENDING', '2220 Barton Springs Rd, Austin, TX 78746', ST_SetSRID(ST_MakePoint(-97.7688, 30.2646), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '240 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '420 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000242', 'cxt-demo', 'b1000000-0000-4000-8000-000000000024', NULL, 'DELIVERY', NULL, 'PENDING', '3401 Cherrywood Rd, Austin, TX 78722', ST_SetSRID(ST_MakePoint(-97.7146, 30.2926), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '600 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000251', 'cxt-demo', 'b1000000-0000-4000-8000-000000000025', NULL, 'PICKUP', NULL, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '240 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '420 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000252', 'cxt-demo', 'b1000000-0000-4000-8000-000000000025', NULL, 'DELIVERY', NULL, 'PENDING', '1100 S Lamar Blvd, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7635, 30.2559), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '300 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '600 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000261', 'cxt-demo', 'b1000000-0000-4000-8000-000000000026', NULL, 'PICKUP', NULL, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '250 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '430 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000262', 'cxt-demo', 'b1000000-0000-4000-8000-000000000026', NULL, 'DELIVERY', NULL, 'PENDING', '7301 Woodrow Ave, Austin, TX 78757', ST_SetSRID(ST_MakePoint(-97.7326, 30.3474), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '270 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '340 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000271', 'cxt-demo', 'b1000000-0000-4000-8000-000000000027', NULL, 'PICKUP', NULL, 'PENDING', '2404 E Riverside Dr, Austin, TX 78741', ST_SetSRID(ST_MakePoint(-97.7202, 30.2333), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '250 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '430 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000272', 'cxt-demo', 'b1000000-0000-4000-8000-000000000027', NULL, 'DELIVERY', NULL, 'PENDING', '1717 Toomey Rd, Austin, TX 78704', ST_SetSRID(ST_MakePoint(-97.7615, 30.2617), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '290 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '410 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000281', 'cxt-demo', 'b1000000-0000-4000-8000-000000000028', NULL, 'PICKUP', NULL, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '260 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '440 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000282', 'cxt-demo', 'b1000000-0000-4000-8000-000000000028', NULL, 'DELIVERY', NULL, 'PENDING', '5555 N Lamar Blvd, Austin, TX 78751', ST_SetSRID(ST_MakePoint(-97.7267, 30.3221), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '620 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000291', 'cxt-demo', 'b1000000-0000-4000-8000-000000000029', NULL, 'PICKUP', NULL, 'PENDING', '1211 W 6th St, Austin, TX 78703', ST_SetSRID(ST_MakePoint(-97.7565, 30.2725), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '260 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '440 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000292', 'cxt-demo', 'b1000000-0000-4000-8000-000000000029', NULL, 'DELIVERY', NULL, 'PENDING', '3663 Bee Caves Rd, Austin, TX 78746', ST_SetSRID(ST_MakePoint(-97.809, 30.2705), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '320 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '620 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000301', 'cxt-demo', 'b1000000-0000-4000-8000-000000000030', NULL, 'PICKUP', NULL, 'PENDING', '2401 E 6th St, Austin, TX 78702', ST_SetSRID(ST_MakePoint(-97.7185, 30.2601), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '270 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '450 minutes'), NULL, NULL),
+  ('b2000000-0000-4000-8000-000000000302', 'cxt-demo', 'b1000000-0000-4000-8000-000000000030', NULL, 'DELIVERY', NULL, 'PENDING', '2901 Montopolis Dr, Austin, TX 78741', ST_SetSRID(ST_MakePoint(-97.704, 30.2287), 4326)::geography, (CURRENT_DATE + TIME '08:00' + INTERVAL '310 minutes'), (CURRENT_DATE + TIME '08:00' + INTERVAL '430 minutes'), NULL, NULL);
 
 INSERT INTO parcels (id, tenant_id, order_id, barcode, description, weight_kg, status) VALUES
   ('b3000000-0000-4000-8000-000000000101', 'cxt-demo', 'b1000000-0000-4000-8000-000000000001', 'PCL-1001-1', 'Small electronics', 5.5, 'PICKED_UP'),
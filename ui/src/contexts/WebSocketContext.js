@@ -2,7 +2,7 @@
  * WebSocket context — live feed of canonical events.
  *
  * Connects to /ws and receives every event on the backbone verbatim in
- * envelope v1 wire form (camelCase):
+ * envelope v1 wire form (camelCase), as binary frames of UTF-8 JSON:
  *   { eventId, eventType, eventVersion, sourceSystem, tenantId,
  *     entityRefs, occurredAt, observedAt, payload, traceId }
  *
@@ -12,6 +12,8 @@ import React, { createContext, useContext, useRef, useCallback, useEffect, useSt
 
 const WebSocketContext = createContext(null);
 
+const utf8 = new TextDecoder();
+
 export const useWebSocket = () => {
   const context = useContext(WebSocketContext);
   if (!context) {
@@ -49,6 +51,7 @@ export const WebSocketProvider = ({ children }) => {
     const url = defaultWsUrl();
     try {
       const ws = new WebSocket(url);
+      ws.binaryType = 'arraybuffer';
       wsRef.current = ws;
 
       ws.onopen = () => {
@@ -59,7 +62,8 @@ export const WebSocketProvider = ({ children }) => {
 
       ws.onmessage = (msg) => {
         try {
-          const envelope = JSON.parse(msg.data);
+          const text = typeof msg.data === 'string' ? msg.data : utf8.decode(msg.data);
+          const envelope = JSON.parse(text);
           if (!envelope.eventType) return;
           setEvents((prev) => [envelope, ...prev.slice(0, 199)]);
           listenersRef.current.forEach((listener) => listener(envelope));